@@ -4,8 +4,6 @@ Bot Scraper untuk Blog LanyardKilat
 Output: JSON file sesuai format import Laravel
 """
 
-import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import json
 import os
@@ -13,241 +11,1091 @@ import re
 import time
 from datetime import datetime
 import sys
+import logging
+import threading
+import functools
+import importlib
+import contextlib
+import heapq
+from collections import Counter, deque
+
+# requests, bs4, dateutil dan mysql.connector di-import saat dibutuhkan (lihat _optional_import
+# dan import lokal di method), supaya --help / cron check tidak membayar biaya import-nya.
+# Budget waktu startup dijaga oleh tests/test_startup.py
+
+logger = logging.getLogger('scrape_blog')
+
+# Atribut standar LogRecord, sisanya dianggap field terstruktur dari extra=
+_LOG_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_import(name, package=None):
+    """Import an optional dependency on first use; warn once and return None if it is missing"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        if package:
+            logger.warning("⚠️  %s tidak terinstall. Install dengan: pip install %s", package, package)
+        return None
+
+
+class JsonLogFormatter(logging.Formatter):
+    """Format log record sebagai satu objek JSON per baris"""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'msg': record.getMessage().strip(),
+        }
+        if record.threadName != 'MainThread':
+            entry['thread'] = record.threadName
+        for key, value in record.__dict__.items():
+            if key not in _LOG_RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ProgressBar:
+    """Progress bar satu baris di stderr (untuk mode --progress)"""
+
+    def __init__(self, stream=None, width=30):
+        self.stream = stream or sys.stderr
+        self.width = width
+        self._visible = False
+
+    def update(self, done, total, label=''):
+        filled = int(self.width * done / total) if total else 0
+        bar = '#' * filled + '-' * (self.width - filled)
+        self.stream.write(f"\r[{bar}] {done}/{total} {label}"[:120].ljust(120))
+        self.stream.flush()
+        self._visible = True
+
+    def clear(self):
+        if self._visible:
+            self.stream.write('\r' + ' ' * 120 + '\r')
+            self.stream.flush()
+            self._visible = False
+
+
+class _ProgressAwareHandler(logging.StreamHandler):
+    """StreamHandler yang menghapus progress bar sebelum menulis log"""
+
+    def __init__(self, stream, progress):
+        super().__init__(stream)
+        self.progress = progress
+
+    def emit(self, record):
+        self.progress.clear()
+        super().emit(record)
+
+
+def setup_logging(log_format='text', level=logging.INFO, progress=False, threads=False):
+    """Configure the scrape_blog logger; return a ProgressBar when progress mode is on
+    
+    With threads=True text lines are prefixed with the thread name (one thread per site in --sites).
+    """
+    bar = ProgressBar() if progress else None
+    if bar:
+        handler = _ProgressAwareHandler(sys.stderr, bar)
+    else:
+        handler = logging.StreamHandler(sys.stdout)
+    if log_format == 'json':
+        handler.setFormatter(JsonLogFormatter())
+    else:
+        handler.setFormatter(logging.Formatter('[%(threadName)s] %(message)s' if threads else '%(message)s'))
+
+    logger.handlers[:] = [handler]
+    logger.setLevel(level)
+    logger.propagate = False
+    return bar
+
+
+# Nama bulan Indonesia -> Inggris supaya bisa dibaca strptime (%B / %b)
+INDONESIAN_MONTHS = {
+    'januari': 'January', 'februari': 'February', 'maret': 'March', 'april': 'April',
+    'mei': 'May', 'juni': 'June', 'juli': 'July', 'agustus': 'August',
+    'september': 'September', 'oktober': 'October', 'november': 'November', 'desember': 'December',
+    'jan': 'Jan', 'feb': 'Feb', 'mar': 'Mar', 'apr': 'Apr', 'jun': 'Jun', 'jul': 'Jul',
+    'agu': 'Aug', 'agt': 'Aug', 'ags': 'Aug', 'sep': 'Sep', 'okt': 'Oct', 'nov': 'Nov', 'des': 'Dec',
+}
+_MONTH_RE = re.compile(r'\b(' + '|'.join(sorted(INDONESIAN_MONTHS, key=len, reverse=True)) + r')\b\.?', re.IGNORECASE)
+# Nama hari (Indonesia dan Inggris) dibuang sebelum parsing, misalnya "Senin, 4 Maret 2024"
+_WEEKDAY_RE = re.compile(
+    r"\b(senin|selasa|rabu|kamis|jum'?at|sabtu|minggu|ahad|"
+    r"mon(day)?|tue(sday)?|wed(nesday)?|thu(rsday)?|fri(day)?|sat(urday)?|sun(day)?)\b,?",
+    re.IGNORECASE,
+)
+
+
+class DateParser:
+    """Cached date parser that learns the site's date format for a direct strptime path"""
+    
+    FORMATS = (
+        '%Y-%m-%d',
+        '%d %B %Y',
+        '%d %b %Y',
+        '%B %d, %Y',
+        '%b %d, %Y',
+        '%d/%m/%Y',
+        '%m/%d/%Y',
+        '%d-%m-%Y',
+        '%Y-%m-%d %H:%M:%S',
+        '%Y-%m-%dT%H:%M:%S',
+        '%d %B %Y %H:%M',
+    )
+    
+    def __init__(self, cache_size=4096):
+        self.cache_size = cache_size
+        self._cache = {}  # teks asli -> datetime atau None
+        self._learned = None  # format strptime terakhir yang berhasil
+    
+    def parse(self, text):
+        """Return a datetime for text, or None if it cannot be parsed"""
+        try:
+            return self._cache[text]
+        except KeyError:
+            pass
+        
+        dt = self._parse(text)
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[text] = dt
+        return dt
+    
+    def _parse(self, text):
+        normalized = self.normalize(text)
+        if not normalized:
+            return None
+        
+        # Fast path: format yang sudah terbukti cocok untuk situs ini
+        if self._learned:
+            try:
+                return datetime.strptime(normalized, self._learned)
+            except ValueError:
+                pass
+        
+        for fmt in self.FORMATS:
+            if fmt == self._learned:
+                continue
+            try:
+                dt = datetime.strptime(normalized, fmt)
+            except ValueError:
+                continue
+            self._learned = fmt
+            return dt
+        
+        # Slow path: fuzzy parsing dateutil (tidak dipelajari karena formatnya tidak diketahui)
+        date_parser = _optional_import('dateutil.parser', 'python-dateutil')
+        if date_parser:
+            try:
+                return date_parser.parse(normalized, fuzzy=True)
+            except (ValueError, OverflowError):
+                pass
+        return None
+    
+    @staticmethod
+    def normalize(text):
+        """Strip weekday names and translate Indonesian month names to English"""
+        text = _WEEKDAY_RE.sub(' ', text)
+        text = _MONTH_RE.sub(lambda m: INDONESIAN_MONTHS[m.group(1).lower()], text)
+        return ' '.join(text.split()).strip(' ,')
+
+
+def listing_fingerprint(articles):
+    """Fingerprint of a listing page's article text, used to detect a page served twice"""
+    import hashlib
+    digest = hashlib.sha1()
+    for article in articles:
+        digest.update(article.get_text(' ', strip=True).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class Pagination:
+    """Resolve listing page URLs: follow rel=next links, else a URL scheme detected once per site"""
+    
+    SCHEMES = ('{base}/page/{page}', '{base}?page={page}')
+    NEXT_TEXT_RE = re.compile(r'^\s*(next|selanjutnya|berikutnya|older|›|»|→)', re.IGNORECASE)
+    
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.scheme = None  # Skema yang terbukti menghasilkan post
+        self.uses_links = False  # Situs menyediakan link halaman berikutnya
+    
+    def candidates(self, page):
+        """URLs to try for a page number, in order"""
+        if page == 1:
+            return [self.base_url]
+        if self.scheme:
+            return [self.scheme.format(base=self.base_url, page=page)]
+        return [scheme.format(base=self.base_url, page=page) for scheme in self.SCHEMES]
+    
+    def confirm(self, url, page):
+        """Remember which scheme produced posts so later pages cost a single request"""
+        if page == 1 or self.scheme:
+            return
+        for scheme in self.SCHEMES:
+            if scheme.format(base=self.base_url, page=page) == url:
+                self.scheme = scheme
+                logger.info("  🔎 Skema pagination terdeteksi: %s", scheme.format(base=self.base_url, page='N'))
+                return
+    
+    def find_next_link(self, soup, url):
+        """Return the absolute URL of the next listing page advertised by the page, or None"""
+        link = (
+            soup.find('link', rel='next', href=True) or
+            soup.find('a', rel='next', href=True) or
+            soup.select_one('a.next[href], li.next > a[href], .nav-links a.next[href]')
+        )
+        if not link:
+            for container in soup.select('.pagination, .nav-links, nav'):
+                link = container.find('a', href=True, string=self.NEXT_TEXT_RE)
+                if link:
+                    break
+        if not link:
+            return None
+        
+        href = link['href'].strip()
+        if not href or href.startswith('#') or href.startswith('javascript:'):
+            return None
+        next_url = urljoin(url, href)
+        if next_url == url:
+            return None
+        self.uses_links = True
+        return next_url
+    
+    def is_last_page(self, next_url):
+        """True when the site uses next links and the current page has none"""
+        return self.uses_links and not next_url
+
+
+class CrawlCheckpoint:
+    """Append-only JSON-lines journal of crawl progress, replayed by --resume"""
+    
+    def __init__(self, path, base_url):
+        self.path = path
+        self.base_url = base_url
+        self._file = None
+    
+    def load(self):
+        """Replay the journal and return the resume state, or None if there is nothing to resume"""
+        if not os.path.exists(self.path):
+            return None
+        
+        state = {'page': 1, 'next_url': None, 'queue': None, 'original_count': 0, 'completed': {}}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        break  # Baris terakhir terpotong (crash saat menulis)
+                    kind = event.get('event')
+                    if kind == 'start':
+                        if event.get('base_url') != self.base_url:
+                            logger.warning("⚠️  Checkpoint untuk %s, bukan %s - diabaikan", event.get('base_url'), self.base_url)
+                            return None
+                    elif kind == 'page':
+                        state.update(page=event['page'], next_url=event.get('next_url'),
+                                     queue=[PostRecord.from_dict(post) for post in event['queue']],
+                                     original_count=event['original_count'], completed={})
+                    elif kind == 'post':
+                        post = PostRecord.from_dict(event['post'])
+                        state['completed'][post.slug] = post
+                    elif kind == 'page_done':
+                        state.update(page=event['next_page'], next_url=event.get('next_url'), queue=None, completed={})
+        except OSError as e:
+            logger.warning("⚠️  Error membaca checkpoint: %s", e)
+            return None
+        
+        logger.info("♻️  Checkpoint ditemukan: lanjut dari halaman %d", state['page'])
+        return state
+    
+    def start(self):
+        self._rewrite([{'event': 'start', 'base_url': self.base_url}])
+    
+    def begin_page(self, page, queue, original_count, next_url=None):
+        self._append({'event': 'page', 'page': page, 'queue': [post.to_dict() for post in queue],
+                      'original_count': original_count, 'next_url': next_url})
+    
+    def post_done(self, post):
+        self._append({'event': 'post', 'post': post.to_dict()})
+    
+    def page_done(self, next_page, next_url=None):
+        # Post halaman ini sudah tersimpan di JSON utama, jadi journal cukup dipadatkan ke posisi halaman
+        self._rewrite([{'event': 'start', 'base_url': self.base_url},
+                       {'event': 'page_done', 'next_page': next_page, 'next_url': next_url}])
+    
+    def clear(self):
+        self._close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+    
+    def _append(self, event):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(event, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def _rewrite(self, events):
+        self._close()
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+    
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# Batas ukuran body halaman listing/detail (bisa diubah dengan --max-page-bytes)
+DEFAULT_MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+
+class PageTooLarge(Exception):
+    """Raised when a page body exceeds the configured byte cap"""
+
+
+class FetchQueue:
+    """Priority queue (heapq) of listed posts waiting for their detail fetch
+    
+    Lowest key first: posts never fetched before refreshes of stored posts, then newest sitemap
+    lastmod (posts missing from the sitemap count as newest, the sitemap usually lags), then
+    listing position.
+    """
+    
+    def __init__(self):
+        self._heap = []
+    
+    def push(self, position, post, refresh=False, lastmod=None):
+        freshness = -lastmod if lastmod is not None else float('-inf')
+        # position unik, jadi tuple tidak pernah sampai membandingkan PostRecord
+        heapq.heappush(self._heap, (int(refresh), freshness, position, post))
+    
+    def pop(self):
+        """Return (listing position, post) with the highest priority"""
+        _, _, position, post = heapq.heappop(self._heap)
+        return position, post
+    
+    def __len__(self):
+        return len(self._heap)
+
+
+class PostRecord:
+    """Compact scraped post; Laravel fields that only repeat other fields are derived in to_dict()"""
+    
+    __slots__ = ('title', 'url', 'slug', 'excerpt', 'published_at', 'author', 'thumbnail_path',
+                 'categories', 'tags', 'body', 'fetched_at', 'overrides', 'persisted')
+    
+    # Field yang boleh berbeda dari nilai default/turunan (misalnya data dari database)
+    OVERRIDABLE = ('type', 'status', 'is_featured', 'price', 'og_image', 'redirect_url',
+                   'meta_title', 'meta_description', 'meta_keywords')
+    
+    def __init__(self, title, slug, url=None, excerpt='', published_at=None, author='Admin',
+                 thumbnail_path=None, categories=None, tags=None, body='', fetched_at=None, overrides=None):
+        self.title = title
+        self.slug = slug
+        self.url = url
+        self.excerpt = excerpt
+        self.published_at = published_at
+        self.author = author
+        self.thumbnail_path = thumbnail_path
+        self.categories = categories or []
+        self.tags = tags or []
+        self.body = body
+        self.fetched_at = fetched_at  # Waktu body terakhir berhasil di-fetch (ISO 8601), dibandingkan dengan lastmod sitemap
+        self.overrides = overrides  # None untuk post hasil scraping
+        self.persisted = False  # True setelah post tersimpan di store dan body dilepas dari memori
+    
+    def to_dict(self):
+        """Full post dict in the Laravel import format"""
+        data = {
+            'title': self.title,
+            'url': self.url,
+            'slug': self.slug,
+            'excerpt': self.excerpt,
+            'published_at': self.published_at,
+            'source_published_at': self.published_at,  # Tanggal post di blog sumber (hasil DateParser)
+            'author': self.author,
+            'thumbnail_path': self.thumbnail_path,
+            'categories': self.categories,
+            'tags': self.tags,
+            'body': self.body,
+            # Defaults sesuai format Laravel
+            'type': 'post',
+            'status': 'draft',  # Set sebagai draft, bukan published
+            'is_featured': False,
+            'price': None,
+            'og_image': self.thumbnail_path,  # Fallback ke thumbnail jika tidak ada
+            'redirect_url': None,
+            'meta_title': self.title,
+            'meta_description': self.excerpt,
+            'meta_keywords': ', '.join(self.tags) if self.tags else None,
+            'fetched_at': self.fetched_at,
+        }
+        if self.overrides:
+            data.update(self.overrides)
+        if data['status'] == 'draft':
+            # Draft Laravel belum dipublish; tanggal sumber tetap tersimpan di source_published_at
+            data['published_at'] = None
+        return data
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a post dict, keeping only fields that differ from the derived values"""
+        record = cls(
+            title=data.get('title') or '',
+            slug=data.get('slug') or '',
+            url=data.get('url'),
+            excerpt=data.get('excerpt') or '',
+            published_at=data.get('source_published_at') or data.get('published_at'),
+            author=data.get('author'),
+            thumbnail_path=data.get('thumbnail_path'),
+            categories=data.get('categories'),
+            tags=data.get('tags'),
+            body=data.get('body') or '',
+            fetched_at=data.get('fetched_at'),
+        )
+        derived = record.to_dict()
+        overrides = {key: data[key] for key in cls.OVERRIDABLE if key in data and data[key] != derived[key]}
+        record.overrides = overrides or None
+        return record
+    
+    def release_body(self):
+        """Drop the body once it is persisted so memory does not grow with total body size"""
+        self.body = None
+        self.persisted = True
 
-# Try to import mysql connector
-try:
-    import mysql.connector
-    from mysql.connector import Error
-    HAS_MYSQL = True
-except ImportError:
-    HAS_MYSQL = False
-    print("⚠️  mysql-connector-python tidak terinstall. Install dengan: pip install mysql-connector-python")
-
-# Try to import dateutil, fallback to manual parsing
-try:
-    from dateutil import parser as date_parser
-    HAS_DATEUTIL = True
-except ImportError:
-    HAS_DATEUTIL = False
-    print("⚠️  python-dateutil tidak terinstall. Install dengan: pip install python-dateutil")
-
-# Try to import mysql connector
-try:
-    import mysql.connector
-    from mysql.connector import Error
-    HAS_MYSQL = True
-except ImportError:
-    HAS_MYSQL = False
-    # Don't print warning here, only when user tries to use database feature
 
 class BlogScraper:
-    def __init__(self, base_url="https://lanyardkilat.co.id/blog", max_pages=None, posts_per_page=10):
+    def __init__(self, base_url="https://lanyardkilat.co.id/blog", max_pages=None, posts_per_page=10, output_dir=None):
+        output_dir = output_dir or os.path.dirname(__file__)  # Folder store, checkpoint dan images/
         self.base_url = base_url
         self.max_pages = max_pages  # None = semua halaman
         self.posts_per_page = posts_per_page
         self.posts = []
-        self.images_dir = os.path.join(os.path.dirname(__file__), "images")
+        self.json_path = os.path.join(output_dir, 'scraped_posts.json')
+        self.compress_bodies = None  # gzip/zstd: body disimpan terkompresi di scraped_posts.json
+        self.stats = Counter()  # Statistik transfer: responses, wire_bytes, decoded_bytes
+        self.validators = {}  # url -> (ETag, Last-Modified) untuk conditional request di mode watch
+        self.archive = None  # HtmlArchive jika --archive, menyimpan response mentah untuk --reextract
+        self.progress = None  # ProgressBar, diisi dari main() jika --progress
+        self.max_page_bytes = DEFAULT_MAX_PAGE_BYTES  # 0 = tanpa batas
+        self.output = 'json'  # json, db, atau both
+        self.db_sink = None  # MySQLSink untuk output db/both
+        self.selectors = {}  # Selector CSS per site: 'article' (listing) dan 'content' (body detail)
+        self.post_delay = 2  # Detik antar post
+        self.page_delay = 3  # Detik antar halaman listing
+        self.fetch_slots = None  # FetchSlots budget fetch bersama di mode --sites
+        self.time_budget = None  # Detik; setelah habis crawl berhenti rapi dan sisa antrian tetap di checkpoint
+        self.sitemap_url = None  # Sumber lastmod untuk prioritas fetch dan refresh post yang berubah
+        self.refresh_slugs = set()  # Post di store yang di-fetch ulang karena lastmod sitemap lebih baru
+        self.fetched_times = {}  # slug -> fetched_at post di store (dari sidecar index), untuk refresh
+        self.date_parser = DateParser()
+        self.pagination = Pagination(base_url)
+        self.checkpoint = CrawlCheckpoint(os.path.join(output_dir, 'scrape_checkpoint.jsonl'), base_url)
+        self.images_dir = os.path.join(output_dir, "images")
         
         # Create images directory
         os.makedirs(self.images_dir, exist_ok=True)
         
         # Setup session
+        import requests
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': ', '.join(accepted_encodings()),
         })
     
     def load_existing_posts(self):
-        """Load existing posts from JSON to avoid duplicates"""
-        filepath = os.path.join(os.path.dirname(__file__), 'scraped_posts.json')
+        """Load existing slugs and thumbnail paths, from the sidecar index when it matches the store"""
+        filepath = self.json_path
         existing_slugs = set()
         existing_images = set()
         
+        # Journal sisa crawl yang terhenti (crash / generator tidak dihabiskan) digabung dulu
+        self.compact_store()
         if os.path.exists(filepath):
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            index = read_store_index(filepath)
+            if index is None:
+                # Index tidak ada / basi: baca store penuh sekali lalu tulis ulang index-nya
+                try:
+                    data = load_json(filepath)
                     if 'posts' in data and isinstance(data['posts'], list):
-                        for post in data['posts']:
-                            if 'slug' in post:
-                                existing_slugs.add(post['slug'])
-                            if 'thumbnail_path' in post and post['thumbnail_path']:
-                                existing_images.add(post['thumbnail_path'])
-                        print(f"📋 Ditemukan {len(existing_slugs)} posts yang sudah ada di JSON")
-            except Exception as e:
-                print(f"⚠️  Error membaca file JSON: {e}")
+                        index = write_store_index(filepath, data['posts'])
+                except Exception as e:
+                    logger.warning("⚠️  Error membaca file JSON: %s", e)
+            if index is not None:
+                existing_slugs.update(index['slugs'])
+                existing_images.update(index['images'])
+                self.fetched_times = index.get('fetched') or {}
+                logger.info("📋 Ditemukan %d posts yang sudah ada di JSON", len(existing_slugs))
         
         return existing_slugs, existing_images
     
-    def scrape(self):
+    def scrape(self, resume=False):
         """Main scraping function"""
-        print(f"🚀 Memulai scraping dari: {self.base_url}")
+        for _ in self.iter_posts(resume=resume):
+            pass
+    
+    def iter_posts(self, resume=False, persist=True, existing_slugs=None):
+        """Crawl the blog lazily, yielding each PostRecord as soon as its body has been fetched
+        
+        The next post is only fetched when the consumer asks for it, so a slow consumer throttles the
+        crawl. With persist=True (CLI) pages are also written to the configured outputs and the
+        checkpoint journal; bodies are released once their page is stored, so copy post.body if it is
+        needed later. With persist=False nothing is written or kept in self.posts: only the slugs in
+        existing_slugs are skipped. After --resume, posts finished before the interruption are yielded
+        again (at-least-once).
+        
+        Within each listing page detail fetches are ordered by a FetchQueue. With sitemap_url set, stored
+        posts whose sitemap lastmod is newer than the store are fetched again after the new ones. With
+        time_budget set the crawl stops once it is used up, keeping the unfetched queue in the checkpoint.
+        """
+        if resume and not persist:
+            raise ValueError("resume membutuhkan persist=True (checkpoint hanya ditulis saat persist)")
+        logger.info("🚀 Memulai scraping dari: %s", self.base_url)
         
         # Load existing posts untuk skip yang sudah ada
-        existing_slugs, existing_images = self.load_existing_posts()
+        if not persist:
+            existing_slugs = set(existing_slugs or ())
+        elif self.output == 'db':
+            existing_slugs = set()
+        else:
+            existing_slugs, existing_images = self.load_existing_posts()
+        # Slug di store (bukan yang terlihat selama run ini), kandidat refresh
+        store_slugs = set(existing_slugs) if persist else set()
+        if persist and self.db_sink:
+            existing_slugs |= self.db_sink.existing_slugs()
+        sitemap = self.load_sitemap(self.sitemap_url) if self.sitemap_url else {}
+        deadline = time.monotonic() + self.time_budget if self.time_budget else None
+        out_of_time = False
         
         if self.max_pages is None:
-            print(f"📄 Mode: Semua halaman (tanpa limit)")
+            logger.info("📄 Mode: Semua halaman (tanpa limit)")
         else:
-            print(f"📄 Mode: Maksimal {self.max_pages} halaman")
+            logger.info("📄 Mode: Maksimal %d halaman", self.max_pages)
         
         if self.posts_per_page:
-            print(f"📝 Limit: {self.posts_per_page} posts per halaman\n")
+            logger.info("📝 Limit: %d posts per halaman\n", self.posts_per_page)
         else:
-            print(f"📝 Limit: Semua posts per halaman\n")
+            logger.info("📝 Limit: Semua posts per halaman\n")
+        
+        # Checkpoint: lanjutkan dari journal jika --resume, selain itu mulai journal baru
+        checkpoint = self.checkpoint if persist else None
+        state = checkpoint.load() if resume else None
+        if resume and state is None:
+            logger.info("ℹ️  Tidak ada checkpoint yang cocok, mulai dari awal")
+        if checkpoint and state is None:
+            checkpoint.start()
         
-        page = 1
+        page = state['page'] if state else 1
+        next_url = state['next_url'] if state else None  # link rel=next dari halaman sebelumnya
+        seen_fingerprints = set()
         has_more = True
         total_scraped = 0
         skipped_count = 0
         
-        while has_more:
-            # Check max pages limit
-            if self.max_pages is not None and page > self.max_pages:
-                print(f"⏹️  Mencapai limit {self.max_pages} halaman, berhenti scraping.\n")
-                break
-            
-            # Coba berbagai format pagination
-            if page == 1:
-                url = self.base_url
-            else:
-                # Coba format /page/{page} dulu (umum untuk WordPress/Laravel)
-                url = f"{self.base_url}/page/{page}"
-            
-            print(f"📖 Scraping halaman {page}: {url}")
-            
-            posts = self.scrape_page(url, existing_slugs)
-            
-            if not posts:
-                # Jika halaman kosong, coba format alternatif
-                if page > 1:
-                    alt_url = f"{self.base_url}?page={page}"
-                    print(f"  🔄 Mencoba format alternatif: {alt_url}")
-                    posts = self.scrape_page(alt_url, existing_slugs)
-                
-                if not posts:
-                    has_more = False
-                    print(f"⚠️  Tidak ada post di halaman {page}, berhenti scraping.\n")
-            else:
-                # Filter out posts that already exist
-                new_posts = []
-                for post in posts:
-                    if post['slug'] in existing_slugs:
-                        skipped_count += 1
-                        print(f"  ⏭️  Skip: '{post['title']}' (sudah ada)")
-                    else:
-                        new_posts.append(post)
-                        existing_slugs.add(post['slug'])  # Add to set to avoid duplicates in same run
-                
-                if not new_posts:
-                    print(f"  ℹ️  Semua posts di halaman {page} sudah ada, skip halaman ini\n")
-                    page += 1
-                    continue
+        try:
+            while has_more:
+                # Check max pages limit
+                if self.max_pages is not None and page > self.max_pages:
+                    logger.info("⏹️  Mencapai limit %d halaman, berhenti scraping.\n", self.max_pages)
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    out_of_time = True
+                    break
                 
-                # Limit posts per page if specified
-                original_count = len(new_posts)
-                if self.posts_per_page and len(new_posts) > self.posts_per_page:
-                    new_posts = new_posts[:self.posts_per_page]
-                    print(f"  ℹ️  Dibatasi dari {original_count} menjadi {self.posts_per_page} posts")
+                if state and state['queue'] is not None:
+                    # Resume di tengah halaman: pakai antrian dari checkpoint tanpa fetch listing lagi
+                    new_posts = state['queue']
+                    original_count = state['original_count']
+                    completed = state['completed']
+                    state = None
+                    for post in new_posts:
+                        existing_slugs.add(post.slug)
+                        # Di store tapi belum selesai = refresh (yang selesai sudah disimpan saat berhenti)
+                        if post.slug in store_slugs and post.slug not in completed:
+                            self.refresh_slugs.add(post.slug)
+                    logger.info("♻️  Melanjutkan halaman %d dari checkpoint: %d selesai, %d tersisa",
+                                page, len(completed), len(new_posts) - len(completed))
+                else:
+                    completed = {}
+                    
+                    # Ikuti link rel=next dari halaman sebelumnya; tanpa link, pakai skema pagination
+                    # yang sudah terdeteksi (atau coba semua skema sekali sampai satu berhasil)
+                    urls = [next_url] if next_url else self.pagination.candidates(page)
+                    probing = len(urls) > 1  # Skema pagination belum terbukti
+                    posts, repeated = [], False
+                    for attempt, url in enumerate(urls):
+                        if attempt == 0:
+                            logger.info("📖 Scraping halaman %d: %s", page, url)
+                        else:
+                            logger.info("  🔄 Mencoba format alternatif: %s", url)
+                        posts, next_url, repeated = self.scrape_listing(url, seen_fingerprints, probe=probing)
+                        # Halaman berulang berarti akhir crawl hanya untuk link rel=next / skema yang terbukti;
+                        # saat masih mencoba skema, bisa jadi hanya skema ini yang tidak didukung situs
+                        if posts or (repeated and not probing):
+                            break
+                    
+                    if not posts:
+                        has_more = False
+                        logger.info("⚠️  Tidak ada post di halaman %d, berhenti scraping.\n", page)
+                        break
+                    self.pagination.confirm(url, page)
+                    
+                    # Filter out posts that already exist
+                    new_posts = []
+                    for post in posts:
+                        if post.slug in store_slugs and self._changed_since(post, sitemap):
+                            # Sudah ada di store tapi berubah menurut sitemap: fetch ulang (sekali per run)
+                            store_slugs.discard(post.slug)
+                            self.refresh_slugs.add(post.slug)
+                            new_posts.append(post)
+                            logger.debug("  🔁 Refresh: '%s' (lastmod sitemap lebih baru)", post.title)
+                        elif post.slug in existing_slugs:
+                            skipped_count += 1
+                            logger.debug("  ⏭️  Skip: '%s' (sudah ada)", post.title)
+                        else:
+                            new_posts.append(post)
+                            existing_slugs.add(post.slug)  # Add to set to avoid duplicates in same run
+                    
+                    if not new_posts:
+                        logger.info("  ℹ️  Semua posts di halaman %d sudah ada, skip halaman ini\n", page)
+                        if self.pagination.is_last_page(next_url):
+                            logger.info("ℹ️  Tidak ada link halaman berikutnya, halaman %d dianggap halaman terakhir.\n", page)
+                            break
+                        page += 1
+                        if checkpoint:
+                            checkpoint.page_done(page, next_url)
+                        continue
+                    
+                    # Limit posts per page if specified
+                    original_count = len(new_posts)
+                    if self.posts_per_page and len(new_posts) > self.posts_per_page:
+                        new_posts = new_posts[:self.posts_per_page]
+                        logger.info("  ℹ️  Dibatasi dari %d menjadi %d posts", original_count, self.posts_per_page)
+                    
+                    if checkpoint:
+                        checkpoint.begin_page(page, new_posts, original_count, next_url)
                 
                 # Download gambar dan ambil body lengkap untuk setiap post
-                print(f"  📥 Memproses {len(new_posts)} posts baru...")
+                logger.info("  📥 Memproses %d posts baru...", len(new_posts))
                 success_count = 0
                 failed_count = 0
                 
-                for i, post in enumerate(new_posts, 1):
-                    try:
-                        print(f"\n    [{i}/{len(new_posts)}] {post.get('title', 'N/A')}")
-                        
-                        # Scrape detail page untuk body lengkap dengan retry
-                        if post.get('url'):
-                            print(f"      → Mengambil konten lengkap: {post['url']}")
-                            
-                            # Retry mechanism untuk memastikan konten FULL ter-download
-                            body = None
-                            max_retries = 3
-                            for retry in range(max_retries):
-                                try:
-                                    body = self.scrape_post_detail(post['url'])
-                                    if body and len(body.strip()) > 50:
-                                        break  # Berhasil, keluar dari retry loop
-                                    elif retry < max_retries - 1:
-                                        print(f"      ⚠️  Retry {retry + 1}/{max_retries} (konten terlalu pendek)...")
-                                        time.sleep(3)  # Delay lebih lama sebelum retry
-                                except Exception as e:
-                                    if retry < max_retries - 1:
-                                        print(f"      ⚠️  Error, retry {retry + 1}/{max_retries}: {e}")
-                                        time.sleep(3)
-                                    else:
-                                        print(f"      ❌ Gagal setelah {max_retries} kali retry: {e}")
-                            
-                            post['body'] = body if body else ''
-                            
-                            if body and len(body.strip()) > 50:
-                                success_count += 1
-                                print(f"      ✅ Konten FULL berhasil diambil ({len(body)} karakter)")
-                            else:
-                                failed_count += 1
-                                print(f"      ⚠️  Konten tidak berhasil diambil atau terlalu pendek")
+                queue = FetchQueue()
+                for position, post in enumerate(new_posts):
+                    queue.push(position, post, refresh=post.slug in self.refresh_slugs,
+                               lastmod=sitemap.get(post.url.rstrip('/')) if post.url else None)
+                finished = []
+                
+                while queue:
+                    position, post = queue.pop()
+                    if post.slug in completed:
+                        # Sudah diproses sebelum crawl terhenti
+                        new_posts[position] = post = completed[post.slug]
+                        if post.body:
+                            success_count += 1
                         else:
-                            post['body'] = ''
                             failed_count += 1
-                            print(f"      ⚠️  URL tidak tersedia")
-                        
-                        # Delay antar request lebih lama untuk memastikan semua ter-download FULL
-                        if i < len(new_posts):  # Tidak delay untuk post terakhir
-                            print(f"      ⏳ Menunggu 2 detik sebelum post berikutnya...")
-                            time.sleep(2)  # Delay lebih lama untuk memastikan semua ter-download FULL
-                            
-                    except Exception as e:
+                        finished.append(post)
+                        yield post
+                        continue
+                    
+                    if deadline is not None and time.monotonic() >= deadline:
+                        out_of_time = True
+                        break
+                    
+                    if self.process_post(post):
+                        success_count += 1
+                    else:
                         failed_count += 1
-                        post['body'] = ''
-                        print(f"      ❌ Error memproses post: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        continue  # Lanjut ke post berikutnya meskipun ada error
+                    if checkpoint:
+                        checkpoint.post_done(post)
+                    
+                    finished.append(post)
+                    if self.progress:
+                        self.progress.update(len(finished), len(new_posts), f"halaman {page}")
+                    
+                    yield post
+                    
+                    # Delay antar request lebih lama untuk memastikan semua ter-download FULL
+                    if queue:  # Tidak delay untuk post terakhir
+                        logger.debug("      ⏳ Menunggu %s detik sebelum post berikutnya...", self.post_delay)
+                        time.sleep(self.post_delay)  # Delay lebih lama untuk memastikan semua ter-download FULL
                 
-                print(f"\n  ✅ Selesai memproses: {success_count} berhasil, {failed_count} gagal dari {len(new_posts)} posts")
+                if self.progress:
+                    self.progress.clear()
+                if out_of_time:
+                    # Simpan yang sudah selesai; sisa antrian halaman ini tetap di checkpoint
+                    if persist and finished:
+                        self.posts.extend(finished)
+                        self.persist(finished)
+                    total_scraped += len(finished)
+                    break
+                logger.info("\n  ✅ Selesai memproses: %d berhasil, %d gagal dari %d posts", success_count, failed_count, len(new_posts))
                 
-                self.posts.extend(new_posts)
                 total_scraped += len(new_posts)
                 
-                # Save to JSON after each page (incremental save)
-                self.save_to_json()
+                # Save to JSON / database after each page (incremental save)
+                if persist:
+                    self.posts.extend(new_posts)
+                    self.persist(new_posts)
                 
-                print(f"✅ Selesai halaman {page}: {len(new_posts)} post baru (Total: {total_scraped}, Skip: {skipped_count})\n")
+                logger.info("✅ Selesai halaman %d: %d post baru (Total: %d, Skip: %d)\n", page, len(new_posts), total_scraped, skipped_count)
                 
                 # If limited per page, stop after processing this page
                 if self.posts_per_page:
                     has_more = False
-                    print(f"⏹️  Selesai memproses {self.posts_per_page} posts per halaman.\n")
+                    logger.info("⏹️  Selesai memproses %d posts per halaman.\n", self.posts_per_page)
                 elif len(new_posts) < original_count:
                     # Got less than expected, might be last page
                     has_more = False
-                    print(f"ℹ️  Halaman {page} memiliki kurang dari expected posts, dianggap halaman terakhir.\n")
+                    logger.info("ℹ️  Halaman %d memiliki kurang dari expected posts, dianggap halaman terakhir.\n", page)
+                elif self.pagination.is_last_page(next_url):
+                    has_more = False
+                    logger.info("ℹ️  Tidak ada link halaman berikutnya, halaman %d dianggap halaman terakhir.\n", page)
                 else:
                     page += 1
-            
-            # Delay untuk menghindari rate limiting (lebih lama untuk memastikan semua ter-download FULL)
-            print(f"  ⏳ Menunggu 3 detik sebelum halaman berikutnya...")
-            time.sleep(3)
+                if checkpoint:
+                    checkpoint.page_done(page, next_url)
+                
+                # Delay untuk menghindari rate limiting (lebih lama untuk memastikan semua ter-download FULL)
+                logger.debug("  ⏳ Menunggu %s detik sebelum halaman berikutnya...", self.page_delay)
+                time.sleep(self.page_delay)
+        except KeyboardInterrupt:
+            if not checkpoint:
+                raise
+            logger.warning("⏸️  Scraping dihentikan. Progress tersimpan di %s, lanjutkan dengan --resume", checkpoint.path)
+            return
+        finally:
+            # Halaman disimpan ke journal; store penuh hanya ditulis ulang sekali di akhir crawl
+            if persist and self.output != 'db':
+                self.compact_store()
+        
+        if out_of_time:
+            logger.warning("⏱️  Batas waktu %s detik habis setelah %d post baru", self.time_budget, total_scraped)
+            if checkpoint:
+                logger.warning("⏸️  Sisa antrian tersimpan di %s, lanjutkan dengan --resume", checkpoint.path)
+            self.log_transfer_stats()
+            return
+        
+        # Crawl selesai normal, checkpoint tidak diperlukan lagi
+        if checkpoint:
+            checkpoint.clear()
         
-        print(f"📊 Total posts baru: {total_scraped}")
+        logger.info("📊 Total posts baru: %d", total_scraped)
         if skipped_count > 0:
-            print(f"⏭️  Posts dilewati (sudah ada): {skipped_count}")
-        print(f"📁 Total semua posts di JSON: {len(self.posts)}\n")
+            logger.info("⏭️  Posts dilewati (sudah ada): %d", skipped_count)
+        if persist:
+            logger.info("📁 Total semua posts di JSON: %d\n", len(self.posts))
+        self.log_transfer_stats()
+    
+    def load_sitemap(self, url, depth=0):
+        """Return {post url: lastmod timestamp} from a sitemap, following nested sitemap indexes"""
+        import xml.etree.ElementTree as ET
+        
+        try:
+            root = ET.fromstring(self.fetch_html(url))
+        except Exception as e:
+            logger.warning("⚠️  Sitemap tidak bisa dibaca (%s): %s", url, e, extra={'url': url})
+            return {}
+        
+        entries = {}
+        for node in root:
+            fields = {child.tag.rsplit('}', 1)[-1]: (child.text or '').strip() for child in node}
+            if not fields.get('loc'):
+                continue
+            if node.tag.endswith('sitemap'):
+                if depth < 2:
+                    entries.update(self.load_sitemap(fields['loc'], depth + 1))
+                continue
+            lastmod = parse_lastmod(fields.get('lastmod'))
+            if lastmod is not None:
+                entries[fields['loc'].rstrip('/')] = lastmod
+        if depth == 0:
+            logger.info("🗺️  Sitemap: %d URL dengan lastmod dari %s", len(entries), url)
+        return entries
+    
+    def _changed_since(self, post, sitemap):
+        """True when the sitemap lastmod is newer than the stored post's fetched_at (or it has none)"""
+        lastmod = sitemap.get(post.url.rstrip('/')) if post.url else None
+        if lastmod is None:
+            return False
+        fetched_at = parse_lastmod(self.fetched_times.get(post.slug))
+        return fetched_at is None or lastmod > fetched_at
+    
+    async def aiter_posts(self, maxsize=16, **kwargs):
+        """Async variant of iter_posts: the crawl runs in a worker thread feeding an asyncio.Queue(maxsize)
+        
+        The worker blocks while the queue is full, so at most maxsize finished posts wait in memory.
+        Keyword arguments are passed to iter_posts; its exceptions are re-raised in the consumer.
+        """
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize)
+        stop = threading.Event()
+        done = object()
+        
+        def worker():
+            posts = self.iter_posts(**kwargs)
+            try:
+                for post in posts:
+                    asyncio.run_coroutine_threadsafe(queue.put(post), loop).result()
+                    if stop.is_set():
+                        break
+                item = done
+            except BaseException as e:
+                item = e
+            finally:
+                posts.close()
+            if not stop.is_set():
+                asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+        
+        thread = threading.Thread(target=worker, name='iter-posts', daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Consumer berhenti lebih awal: hentikan worker setelah post yang sedang di-fetch
+            stop.set()
+            while not queue.empty():
+                queue.get_nowait()
+    
+    def watch(self, interval=300, max_polls=None):
+        """Resident mode: poll the first listing page and scrape only posts not seen before"""
+        logger.info("👀 Mode watch: cek %s setiap %d detik (Ctrl-C untuk berhenti)", self.base_url, interval)
+        
+        # Slug index dimuat sekali dan tetap di memori selama proses berjalan
+        if self.output == 'db':
+            existing_slugs = set()
+        else:
+            existing_slugs, _ = self.load_existing_posts()
+        if self.db_sink:
+            existing_slugs |= self.db_sink.existing_slugs()
+        
+        polls = 0
+        last_digest = None
+        try:
+            while True:
+                polls += 1
+                last_digest = self.poll(existing_slugs, last_digest)
+                if max_polls and polls >= max_polls:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            logger.info("👋 Mode watch dihentikan setelah %d poll", polls)
+        self.log_transfer_stats()
+    
+    def poll(self, existing_slugs, last_digest=None):
+        """One watch cycle; return the digest of the listing body for the next cycle"""
+        import hashlib
+        
+        try:
+            html = self.fetch_html(self.base_url, conditional=True)
+        except Exception as e:
+            logger.warning("⚠️  Poll gagal: %s", e)
+            return last_digest
+        
+        if html is None:
+            logger.debug("  💤 Tidak berubah (304 Not Modified)")
+            return last_digest
+        
+        # Server tanpa ETag/Last-Modified: body yang sama tidak perlu di-parse ulang
+        digest = hashlib.sha1(html).hexdigest()
+        if digest == last_digest:
+            logger.debug("  💤 Tidak berubah (body sama)")
+            return digest
+        
+        posts, _, _ = self.scrape_listing(self.base_url, html=html)
+        new_posts = [post for post in posts if post.slug not in existing_slugs]
+        if not new_posts:
+            logger.debug("  💤 Tidak ada post baru")
+            return digest
+        
+        logger.info("🆕 %d post baru ditemukan", len(new_posts))
+        success_count = 0
+        for i, post in enumerate(new_posts, 1):
+            existing_slugs.add(post.slug)
+            if self.process_post(post):
+                success_count += 1
+            # Jeda antar post sama seperti crawl biasa, supaya burst post baru tidak membebani situs
+            if i < len(new_posts):
+                time.sleep(self.post_delay)
+        self.posts.extend(new_posts)
+        self.persist(new_posts)
+        if self.output != 'db':
+            self.compact_store()
+        logger.info("✅ %d/%d post baru berhasil diambil", success_count, len(new_posts))
+        return digest
+    
+    def process_post(self, post):
+        """Fetch full body for one listed post (with retry); return True on success"""
+        try:
+            logger.debug("\n    %s", post.title)
+            
+            # Scrape detail page untuk body lengkap dengan retry
+            if not post.url:
+                post.body = ''
+                logger.warning("      ⚠️  URL tidak tersedia: %s", post.title)
+                return False
+            
+            logger.debug("      → Mengambil konten lengkap: %s", post.url)
+            
+            # Retry mechanism untuk memastikan konten FULL ter-download
+            body = None
+            max_retries = 3
+            for retry in range(max_retries):
+                try:
+                    body = self.scrape_post_detail(post.url)
+                    if body and len(body.strip()) > 50:
+                        break  # Berhasil, keluar dari retry loop
+                    elif retry < max_retries - 1:
+                        logger.debug("      ⚠️  Retry %d/%d (konten terlalu pendek)...", retry + 1, max_retries)
+                        time.sleep(3)  # Delay lebih lama sebelum retry
+                except PageTooLarge:
+                    break
+                except Exception as e:
+                    if retry < max_retries - 1:
+                        logger.debug("      ⚠️  Error, retry %d/%d: %s", retry + 1, max_retries, e)
+                        time.sleep(3)
+                    else:
+                        logger.warning("      ❌ Gagal setelah %d kali retry: %s", max_retries, e, extra={'url': post.url})
+            
+            post.body = body if body else ''
+            
+            if body and len(body.strip()) > 50:
+                post.fetched_at = datetime.now().astimezone().isoformat(timespec='seconds')
+                logger.debug("      ✅ Konten FULL berhasil diambil (%d karakter)", len(body))
+                return True
+            logger.warning("      ⚠️  Konten tidak berhasil diambil atau terlalu pendek: %s", post.url, extra={'url': post.url})
+            return False
+        except Exception as e:
+            post.body = ''
+            logger.warning("      ❌ Error memproses post: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return False
+    
+    def persist(self, new_posts):
+        """Write a finished page of posts to the configured outputs"""
+        if self.output != 'db':
+            self.save_to_json()
+        if self.db_sink:
+            # Sama seperti store JSON: refresh yang gagal mengambil body tidak boleh menimpa baris lama
+            self.db_sink.write([post for post in new_posts if post.body or post.slug not in self.refresh_slugs])
+        # Body sudah ada di store, tidak perlu disimpan di memori sampai akhir crawl
+        for post in new_posts:
+            post.release_body()
+    
+    def fetch_html(self, url, conditional=False):
+        """Stream a page body up to max_page_bytes and return the raw bytes; raise PageTooLarge past the cap
+        
+        With conditional=True the ETag/Last-Modified of the previous response are sent and None is
+        returned when the server answers 304 Not Modified.
+        """
+        headers = {}
+        if conditional:
+            etag, last_modified = self.validators.get(url, (None, None))
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        with self._fetch_slot():
+            response = self.session.get(url, timeout=30, stream=True, headers=headers)
+            try:
+                if conditional and response.status_code == 304:
+                    self.stats['not_modified'] += 1
+                    return None
+                response.raise_for_status()
+                limit = self.max_page_bytes
+            
+                # Tolak lebih awal jika server sudah memberi tahu ukurannya
+                length = response.headers.get('Content-Length', '')
+                if limit and length.isdigit() and int(length) > limit:
+                    logger.warning("⚠️  Halaman dilewati, Content-Length %s bytes melebihi batas %d: %s",
+                                   length, limit, url, extra={'url': url})
+                    raise PageTooLarge(url)
+            
+                chunks = []
+                received = 0
+                for chunk in response.iter_content(chunk_size=65536):
+                    received += len(chunk)
+                    if limit and received > limit:
+                        logger.warning("⚠️  Halaman dilewati, body melebihi batas %d bytes: %s",
+                                       limit, url, extra={'url': url})
+                        raise PageTooLarge(url)
+                    chunks.append(chunk)
+                self._count_transfer(response, received)
+                if conditional:
+                    self.validators[url] = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                body = b''.join(chunks)
+                if self.archive:
+                    self.archive.put(url, body)
+                return body
+            finally:
+                response.close()
+    
+    def _fetch_slot(self):
+        """Hold one slot of the shared fetch budget (no-op outside --sites)"""
+        return self.fetch_slots or contextlib.nullcontext()
+    
+    def _count_transfer(self, response, decoded_bytes):
+        self.stats['responses'] += 1
+        self.stats['decoded_bytes'] += decoded_bytes
+        # urllib3 menghitung byte yang benar-benar dibaca dari socket (sebelum dekompresi)
+        self.stats['wire_bytes'] += response.raw.tell()
+        self.stats['encoding:' + (response.headers.get('Content-Encoding') or 'identity')] += 1
+    
+    def log_transfer_stats(self):
+        if not self.stats['responses'] and not self.stats['not_modified']:
+            return
+        wire = self.stats['wire_bytes']
+        decoded = self.stats['decoded_bytes']
+        encodings = {key.split(':', 1)[1]: count for key, count in self.stats.items() if key.startswith('encoding:')}
+        logger.info("🌐 Transfer: %d responses (+%d not modified), %.1f KB di jaringan, %.1f KB setelah dekompresi (rasio %.1fx) %s",
+                    self.stats['responses'], self.stats['not_modified'], wire / 1024, decoded / 1024,
+                    decoded / wire if wire else 0, encodings,
+                    extra={'wire_bytes': wire, 'decoded_bytes': decoded, 'encodings': encodings})
     
     def scrape_page(self, url, existing_slugs=None):
         """Scrape posts from a page"""
-        if existing_slugs is None:
-            existing_slugs = set()
+        return self.scrape_listing(url)[0]
+    
+    def scrape_listing(self, url, seen_fingerprints=None, html=None, probe=False):
+        """Scrape a listing page; return (posts, next_url, repeated)
+        
+        next_url is the page's rel=next / pagination link (or None). repeated is True when the
+        page's articles match a page already seen in this crawl (out-of-range index served again).
+        Pass html to parse an already fetched body. With probe=True (an unconfirmed pagination scheme
+        being tried) fetch errors and repeated pages are only logged at DEBUG.
+        """
+        log_level = logging.DEBUG if probe else logging.INFO
+        from bs4 import BeautifulSoup
         
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            if html is None:
+                html = self.fetch_html(url)
             
             # Use html.parser (built-in, no extra dependencies needed)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
             posts = []
             
             # Cari semua artikel/post - berbagai selector yang mungkin
@@ -257,22 +1105,28 @@ class BlogScraper:
             # Cari artikel berdasarkan struktur yang terlihat di website
             articles = []
             
+            # Method 0: Selector artikel dari konfigurasi site (--sites)
+            if self.selectors.get('article'):
+                articles = soup.select(self.selectors['article'])
+                if articles:
+                    logger.debug("  📋 Ditemukan %d artikel dengan selector site %s", len(articles), self.selectors['article'])
+            
             # Method 1: Cari article tag
-            if soup.find_all('article'):
+            if not articles and soup.find_all('article'):
                 articles = soup.find_all('article')
-                print(f"  📋 Ditemukan {len(articles)} artikel dengan tag <article>")
+                logger.debug("  📋 Ditemukan %d artikel dengan tag <article>", len(articles))
             
             # Method 2: Cari div dengan class post/blog-item/entry
             if not articles:
                 articles = soup.find_all('div', class_=re.compile(r'post|blog-item|entry|card'))
                 if articles:
-                    print(f"  📋 Ditemukan {len(articles)} artikel dengan class post/blog-item/entry/card")
+                    logger.debug("  📋 Ditemukan %d artikel dengan class post/blog-item/entry/card", len(articles))
             
             # Method 3: Cari heading dengan link (h2 a, h3 a)
             if not articles:
                 articles = soup.select('h2 a, h3 a')
                 if articles:
-                    print(f"  📋 Ditemukan {len(articles)} artikel dari heading dengan link")
+                    logger.debug("  📋 Ditemukan %d artikel dari heading dengan link", len(articles))
             
             # Method 4: Cari semua link yang mengarah ke /blog/ (bukan halaman blog itu sendiri)
             if not articles:
@@ -283,7 +1137,7 @@ class BlogScraper:
                            not re.search(r'/blog/(page|category|tag)', link.get('href')) and
                            link.get('href') != '/blog' and link.get('href') != '/blog/']
                 if articles:
-                    print(f"  📋 Ditemukan {len(articles)} link artikel ke /blog/")
+                    logger.debug("  📋 Ditemukan %d link artikel ke /blog/", len(articles))
             
             # Method 5: Cari berdasarkan struktur card/blog post
             if not articles:
@@ -295,50 +1149,64 @@ class BlogScraper:
                     if heading and link:
                         articles.append(card)
                 if articles:
-                    print(f"  📋 Ditemukan {len(articles)} artikel dari struktur card")
+                    logger.debug("  📋 Ditemukan %d artikel dari struktur card", len(articles))
+            
+            next_url = self.pagination.find_next_link(soup, url)
             
             # Extract data dari setiap artikel - PASTIKAN SEMUA DI-PROSES
             if not articles:
-                print(f"  ⚠️  Tidak ada artikel ditemukan di halaman ini")
-                return posts
-            
-            print(f"  🔄 Memproses {len(articles)} artikel...")
+                logger.info("  ⚠️  Tidak ada artikel ditemukan di halaman ini: %s", url)
+                return posts, next_url, False
+            
+            # Fingerprint dihitung sebelum extract supaya halaman ulang tidak memicu download gambar
+            if seen_fingerprints is not None:
+                fingerprint = listing_fingerprint(articles)
+                if fingerprint in seen_fingerprints:
+                    logger.log(log_level, "  🔁 Halaman sama dengan halaman sebelumnya (index di luar jangkauan): %s", url)
+                    return posts, None, True
+                seen_fingerprints.add(fingerprint)
+            
+            logger.debug("  🔄 Memproses %d artikel...", len(articles))
             extracted_count = 0
             skipped_count = 0
+            page_slugs = set()
             
             for idx, article in enumerate(articles, 1):
                 try:
                     post = self.extract_post_data(article, soup)
-                    if post and post.get('title') and post.get('slug'):
+                    if post and post.title and post.slug:
                         # Pastikan URL ada (jika tidak ada, buat dari slug)
-                        if not post.get('url'):
-                            post['url'] = urljoin(self.base_url, f"/blog/{post['slug']}")
-                            print(f"    ⚠️  URL dibuat dari slug: {post['url']}")
+                        if not post.url:
+                            post.url = urljoin(self.base_url, f"/blog/{post.slug}")
+                            logger.debug("    ⚠️  URL dibuat dari slug: %s", post.url)
                         
                         # Cek duplicate dalam batch ini juga
-                        if not any(p.get('slug') == post.get('slug') for p in posts):
+                        if post.slug not in page_slugs:
+                            page_slugs.add(post.slug)
                             posts.append(post)
                             extracted_count += 1
-                            print(f"    ✅ [{idx}/{len(articles)}] Post: {post.get('title', 'N/A')[:50]} | URL: {post.get('url', 'N/A')[:60]}")
+                            logger.debug("    ✅ [%d/%d] Post: %.50s | URL: %.60s", idx, len(articles), post.title, post.url)
                         else:
                             skipped_count += 1
-                            print(f"    ⏭️  [{idx}/{len(articles)}] Duplicate: {post.get('title', 'N/A')[:50]}")
+                            logger.debug("    ⏭️  [%d/%d] Duplicate: %.50s", idx, len(articles), post.title)
                     else:
                         skipped_count += 1
-                        print(f"    ⚠️  [{idx}/{len(articles)}] Post tidak valid (title: {post.get('title') if post else 'None'}, slug: {post.get('slug') if post else 'None'}, url: {post.get('url') if post else 'None'})")
+                        logger.debug("    ⚠️  [%d/%d] Post tidak valid (title: %s, slug: %s, url: %s)", idx, len(articles),
+                                     post.title if post else None, post.slug if post else None, post.url if post else None)
                 except Exception as e:
                     skipped_count += 1
-                    print(f"    ❌ [{idx}/{len(articles)}] Error extracting post: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.warning("    ❌ [%d/%d] Error extracting post: %s", idx, len(articles), e,
+                                   exc_info=logger.isEnabledFor(logging.DEBUG))
                     continue  # Lanjut ke artikel berikutnya meskipun ada error
             
-            print(f"  ✅ Berhasil extract {extracted_count} posts baru, {skipped_count} dilewati dari {len(articles)} artikel")
+            logger.info("  ✅ Berhasil extract %d posts baru, %d dilewati dari %d artikel", extracted_count, skipped_count, len(articles))
             
-            return posts
+            return posts, next_url, False
+        except PageTooLarge:
+            return [], None, False
         except Exception as e:
-            print(f"❌ Error scraping {url}: {e}")
-            return []
+            logger.log(logging.DEBUG if probe else logging.ERROR, "❌ Error scraping %s: %s", url, e, extra={'url': url})
+            return [], None, False
     
     def extract_post_data(self, article, soup):
         """Extract post data from article element"""
@@ -434,7 +1302,7 @@ class BlogScraper:
                 # Jika tidak ada URL, buat dari title (fallback)
                 post['slug'] = self.slugify(post['title'])
                 post['url'] = urljoin(self.base_url, f"/blog/{post['slug']}")
-                print(f"      ⚠️  URL tidak ditemukan di HTML, menggunakan fallback: {post['url']}")
+                logger.debug("      ⚠️  URL tidak ditemukan di HTML, menggunakan fallback: %s", post['url'])
             
             # Extract excerpt
             excerpt_elem = (
@@ -451,39 +1319,10 @@ class BlogScraper:
             )
             date_text = date_elem.get_text(strip=True) if date_elem else None
             
-            # Parse date to ISO format
+            # Parse date to ISO format (None jika format tidak dikenali)
             if date_text:
-                try:
-                    if HAS_DATEUTIL:
-                        # Try to parse date string to datetime
-                        dt = date_parser.parse(date_text, fuzzy=True)
-                        post['published_at'] = dt.isoformat()
-                    else:
-                        # Manual parsing for common formats
-                        # Try common date formats
-                        date_formats = [
-                            '%Y-%m-%d',
-                            '%d %B %Y',
-                            '%d %b %Y',
-                            '%B %d, %Y',
-                            '%b %d, %Y',
-                            '%d/%m/%Y',
-                            '%m/%d/%Y',
-                        ]
-                        parsed = False
-                        for fmt in date_formats:
-                            try:
-                                dt = datetime.strptime(date_text, fmt)
-                                post['published_at'] = dt.isoformat()
-                                parsed = True
-                                break
-                            except:
-                                continue
-                        if not parsed:
-                            post['published_at'] = datetime.now().isoformat()
-                except Exception as e:
-                    # If parsing fails, use current date
-                    post['published_at'] = datetime.now().isoformat()
+                dt = self.date_parser.parse(date_text)
+                post['published_at'] = dt.isoformat() if dt else None
             else:
                 post['published_at'] = None
             
@@ -517,40 +1356,21 @@ class BlogScraper:
             
             # Body akan di-scrape nanti setelah semua post di-list
             # Ini untuk menghindari terlalu banyak request sekaligus
-            post['body'] = ''  # Temporary, akan diisi nanti saat proses
-            
-            # Set defaults sesuai format Laravel
-            post['type'] = 'post'
-            post['status'] = 'draft'  # Set sebagai draft, bukan published
-            post['is_featured'] = False
-            post['price'] = None
-            post['og_image'] = post['thumbnail_path']  # Fallback ke thumbnail jika tidak ada
-            post['redirect_url'] = None
-            post['meta_title'] = post['title']
-            post['meta_description'] = post['excerpt']
-            post['meta_keywords'] = ', '.join(post['tags']) if post['tags'] else None
-            
-            # Jika status draft, published_at harus None
-            if post['status'] == 'draft':
-                post['published_at'] = None
-            else:
-                # Pastikan published_at dalam format ISO8601 atau None
-                if post['published_at'] and not isinstance(post['published_at'], str):
-                    post['published_at'] = post['published_at'].isoformat() if hasattr(post['published_at'], 'isoformat') else None
-            
-            return post
+            return PostRecord(**post)
         except Exception as e:
-            print(f"  ⚠️  Error extracting post: {e}")
+            logger.warning("  ⚠️  Error extracting post: %s", e)
             return None
     
-    def scrape_post_detail(self, url):
-        """Scrape full content from post detail page"""
+    def scrape_post_detail(self, url, html=None):
+        """Scrape full content from post detail page (or from an already fetched html body)"""
+        from bs4 import BeautifulSoup
+        
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            if html is None:
+                html = self.fetch_html(url)
             
             # Use html.parser (built-in, no extra dependencies needed)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
             
             # Cari konten artikel - berbagai selector (prioritas dari yang paling spesifik)
             content_selectors = [
@@ -570,6 +1390,8 @@ class BlogScraper:
                 '.blog-content',
                 '.single-content',
             ]
+            if self.selectors.get('content'):
+                content_selectors.insert(0, self.selectors['content'])
             
             content = None
             for selector in content_selectors:
@@ -588,7 +1410,7 @@ class BlogScraper:
                         text_content = content_elem.get_text(strip=True)
                         if text_content and len(text_content) > 100:  # Minimal 100 karakter
                             content = content_elem
-                            print(f"      📄 Konten ditemukan dengan selector: {selector} ({len(text_content)} karakter)")
+                            logger.debug("      📄 Konten ditemukan dengan selector: %s (%d karakter)", selector, len(text_content))
                             break
                 except Exception as e:
                     continue
@@ -606,7 +1428,7 @@ class BlogScraper:
                                 content.append(elem)
                         text_content = content.get_text(strip=True)
                         if text_content and len(text_content) > 100:
-                            print(f"      📄 Konten ditemukan dari paragraf (fallback 1) ({len(text_content)} karakter)")
+                            logger.debug("      📄 Konten ditemukan dari paragraf (fallback 1) (%d karakter)", len(text_content))
                         else:
                             content = None
             
@@ -621,17 +1443,17 @@ class BlogScraper:
                             for unwanted in div.select('.ad, .ads, .related, .share, .comment, aside, nav, .sidebar, .widget'):
                                 unwanted.decompose()
                             content = div
-                            print(f"      📄 Konten ditemukan dari div dengan class content (fallback 2) ({len(text)} karakter)")
+                            logger.debug("      📄 Konten ditemukan dari div dengan class content (fallback 2) (%d karakter)", len(text))
                             break
             
             if content:
                 # Clean HTML dan preserve structure
                 body = self.clean_html(str(content))
                 if body and len(body.strip()) > 50:  # Pastikan ada konten
-                    print(f"      ✅ Konten HTML FULL berhasil diambil ({len(body)} karakter)")
+                    logger.debug("      ✅ Konten HTML FULL berhasil diambil (%d karakter)", len(body))
                     return body
                 else:
-                    print(f"      ⚠️  Konten terlalu pendek setelah cleaning ({len(body) if body else 0} karakter)")
+                    logger.debug("      ⚠️  Konten terlalu pendek setelah cleaning (%d karakter)", len(body) if body else 0)
                     # Fallback: buat HTML dari text content dengan struktur paragraf
                     text_content = content.get_text(separator='\n', strip=True)
                     if len(text_content) > 100:
@@ -639,11 +1461,11 @@ class BlogScraper:
                         paragraphs = [p.strip() for p in text_content.split('\n') if p.strip() and len(p.strip()) > 20]
                         if paragraphs:
                             html_content = '\n'.join([f'<p>{p}</p>' for p in paragraphs])
-                            print(f"      ℹ️  Menggunakan text content sebagai fallback dengan struktur HTML ({len(html_content)} karakter)")
+                            logger.debug("      ℹ️  Menggunakan text content sebagai fallback dengan struktur HTML (%d karakter)", len(html_content))
                             return html_content
                     return None
             
-            print(f"      ⚠️  Konten tidak ditemukan dengan selector, mencoba fallback terakhir...")
+            logger.debug("      ⚠️  Konten tidak ditemukan dengan selector, mencoba fallback terakhir...")
             # Fallback terakhir: ambil semua text dari body tag
             body_tag = soup.find('body')
             if body_tag:
@@ -660,14 +1482,15 @@ class BlogScraper:
                     paragraphs = [p.strip() for p in fallback_text.split('\n') if p.strip() and len(p.strip()) > 20]
                     if paragraphs:
                         html_content = '\n'.join([f'<p>{p}</p>' for p in paragraphs])
-                        print(f"      ℹ️  Menggunakan body tag sebagai fallback terakhir dengan struktur HTML ({len(html_content)} karakter)")
+                        logger.debug("      ℹ️  Menggunakan body tag sebagai fallback terakhir dengan struktur HTML (%d karakter)", len(html_content))
                         return html_content
             
             return None
+        except PageTooLarge:
+            raise  # Tidak perlu retry, ukurannya tidak akan berubah
         except Exception as e:
-            print(f"      ❌ Error scraping detail: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("      ❌ Error scraping detail %s: %s", url, e, extra={'url': url},
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
     
     def clean_html(self, html):
@@ -675,6 +1498,8 @@ class BlogScraper:
         if not html:
             return ''
         
+        from bs4 import BeautifulSoup
+        
         # Parse dengan BeautifulSoup untuk manipulasi yang lebih baik
         soup = BeautifulSoup(html, 'html.parser')
         
@@ -766,7 +1591,8 @@ class BlogScraper:
             # If no extension, try to detect from content-type
             if not ext:
                 try:
-                    head_response = self.session.head(url, timeout=10, allow_redirects=True)
+                    with self._fetch_slot():
+                        head_response = self.session.head(url, timeout=10, allow_redirects=True)
                     content_type = head_response.headers.get('content-type', '')
                     if 'jpeg' in content_type or 'jpg' in content_type:
                         ext = '.jpg'
@@ -787,7 +1613,7 @@ class BlogScraper:
             
             # Check if file already exists
             if os.path.exists(filepath):
-                print(f"      ⏭️  Gambar sudah ada: {filename}")
+                logger.debug("      ⏭️  Gambar sudah ada: %s", filename)
                 return f"images/{filename}"
             
             # If file exists with different extension, check common extensions
@@ -795,21 +1621,25 @@ class BlogScraper:
             for check_ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif']:
                 check_file = os.path.join(self.images_dir, f"{base_name}{check_ext}")
                 if os.path.exists(check_file):
-                    print(f"      ⏭️  Gambar sudah ada: {os.path.basename(check_file)}")
+                    logger.debug("      ⏭️  Gambar sudah ada: %s", os.path.basename(check_file))
                     return f"images/{os.path.basename(check_file)}"
             
             # Download image
-            response = self.session.get(url, timeout=30, stream=True)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            print(f"      ✅ Gambar disimpan: {filename}")
+            with self._fetch_slot():
+                response = self.session.get(url, timeout=30, stream=True)
+                response.raise_for_status()
+                
+                received = 0
+                with open(filepath, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+                        received += len(chunk)
+                self._count_transfer(response, received)
+            
+            logger.debug("      ✅ Gambar disimpan: %s", filename)
             return f"images/{filename}"
         except Exception as e:
-            print(f"      ⚠️  Gagal download gambar {url}: {e}")
+            logger.warning("      ⚠️  Gagal download gambar %s: %s", url, e, extra={'url': url})
             return None
     
     def slugify(self, text):
@@ -819,46 +1649,269 @@ class BlogScraper:
         text = re.sub(r'[-\s]+', '-', text)
         return text.strip('-')
     
-    def save_to_json(self):
-        """Save posts to JSON file (incremental - merge with existing)"""
-        filepath = os.path.join(os.path.dirname(__file__), 'scraped_posts.json')
+    def reextract(self, workers=None):
+        """Re-run body extraction and cleaning over the HTML archive (no network) and update the store"""
+        from concurrent.futures import ProcessPoolExecutor
         
-        # Load existing posts
-        existing_posts = []
-        if os.path.exists(filepath):
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'posts' in data and isinstance(data['posts'], list):
-                        existing_posts = data['posts']
-            except:
-                existing_posts = []
+        data = self.compact_store()
+        if data is None and not os.path.exists(self.json_path):
+            logger.error("❌ %s tidak ditemukan", self.json_path)
+            return 0
+        data = data or load_json(self.json_path)
+        posts = data.get('posts', [])
+        by_url = {post['url']: post for post in posts if post.get('url')}
         
-        # Merge: existing + new (avoid duplicates by slug)
-        existing_slugs = {post.get('slug') for post in existing_posts if post.get('slug')}
-        merged_posts = existing_posts.copy()
+        entries = [entry for url, entry in self.archive.entries().items() if url in by_url]
+        logger.info("♻️  Re-extract %d halaman dari arsip (%d posts di store)", len(entries), len(posts))
+        if not entries:
+            return 0
         
-        for new_post in self.posts:
-            if new_post.get('slug') not in existing_slugs:
-                merged_posts.append(new_post)
-                existing_slugs.add(new_post.get('slug'))
+        paths = [self.archive.path_for(entry['key']) for entry in entries]
+        updated = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_offline_worker) as pool:
+            for entry, body in zip(entries, pool.map(_reextract_worker, paths, chunksize=16)):
+                if not body:
+                    logger.debug("  ⚠️  Tidak ada konten dari arsip: %s", entry['url'])
+                    continue
+                post = by_url[entry['url']]
+                codec = post.get('body_encoding')
+                post['body'] = encode_body(body, codec) if codec else body
+                updated += 1
         
-        # Save merged data
-        data = {
-            'version': '1.0',
-            'scraped_at': datetime.now().isoformat(),
-            'source_url': self.base_url,
-            'total': len(merged_posts),
-            'posts': merged_posts
-        }
+        compact = self.compress_bodies or any(post.get('body_encoding') for post in posts)
+        dump_json(data, self.json_path, compact=compact)
+        write_store_index(self.json_path, posts)
+        logger.info("✅ %d/%d body diperbarui dari arsip", updated, len(entries))
+        return updated
+    
+    def save_to_json(self):
+        """Append unsaved posts to the store journal; compact_store() merges them into the JSON file
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        Only the new posts are written, so a page save never reads the (possibly huge) store back.
+        """
+        lines = []
+        refreshed = 0
+        for new_post in self.posts:
+            if new_post.persisted:
+                continue
+            # Refresh yang gagal mengambil body tidak boleh menimpa post lama di store
+            refresh = new_post.slug in self.refresh_slugs
+            if refresh and not new_post.body:
+                continue
+            post_data = new_post.to_dict()
+            if self.compress_bodies and post_data['body']:
+                post_data['body'] = encode_body(post_data['body'], self.compress_bodies)
+                post_data['body_encoding'] = self.compress_bodies
+            lines.append(dumps_json({'refresh': refresh, 'post': post_data}, compact=True) + b'\n')
+            refreshed += refresh
+        if not lines:
+            return
         
-        print(f"💾 Data JSON disimpan: {len(merged_posts)} total posts ({len(self.posts)} baru ditambahkan)")
+        with open(store_journal_path(self.json_path), 'ab') as f:
+            f.write(b''.join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+        logger.info("💾 %d posts disimpan ke journal store (%d refresh)", len(lines), refreshed)
+    
+    def compact_store(self):
+        """Merge the store journal into scraped_posts.json (see the compact_store function)"""
+        return compact_store(self.json_path, self.base_url)
+
+
+class HtmlArchive:
+    """Local archive of raw responses: gzip file per URL plus an append-only JSON-lines index"""
+    
+    def __init__(self, directory):
+        self.directory = directory
+        self.index_path = os.path.join(directory, 'index.jsonl')
+        os.makedirs(directory, exist_ok=True)
+    
+    def path_for(self, key):
+        return os.path.join(self.directory, key[:2], key + '.html.gz')
+    
+    def put(self, url, body):
+        """Store the raw body for url (a later fetch of the same URL replaces it)"""
+        import gzip
+        import hashlib
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(path, 'wb', compresslevel=6) as f:
+            f.write(body)
+        entry = {'url': url, 'key': key, 'fetched_at': datetime.now().isoformat(), 'bytes': len(body)}
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    
+    def entries(self):
+        """Latest index entry per URL"""
+        entries = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    entries[entry['url']] = entry
+        return entries
+
+
+# Scraper per proses worker untuk --reextract (hanya dipakai untuk ekstraksi, tanpa network)
+_offline_scraper = None
+
+
+def _init_offline_worker():
+    global _offline_scraper
+    _offline_scraper = BlogScraper()
+    logger.setLevel(logging.WARNING)
+
+
+def _reextract_worker(path):
+    import gzip
+    with gzip.open(path, 'rb') as f:
+        html = f.read()
+    return _offline_scraper.scrape_post_detail(None, html=html)
+
+
+# Default budget fetch bersamaan untuk --sites (bisa diganti dengan "workers" di config atau --workers)
+class FetchSlots:
+    """Fixed number of fetch slots shared between threads, handed out strictly in arrival order
+
+    A released slot goes straight to the longest-waiting thread, so a thread that releases and
+    immediately asks again queues behind the others instead of grabbing the slot back.
+    """
+    
+    def __init__(self, count):
+        self._free = count
+        self._waiters = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        with self._lock:
+            if self._free and not self._waiters:
+                self._free -= 1
+                return
+            turn = threading.Event()
+            self._waiters.append(turn)
+        turn.wait()
+    
+    def release(self):
+        with self._lock:
+            if self._waiters:
+                # Slot langsung diserahkan, tidak pernah kembali ke pool selama masih ada yang antre
+                self._waiters.popleft().set()
+            else:
+                self._free += 1
+    
+    def __enter__(self):
+        self.acquire()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+DEFAULT_SITE_WORKERS = 4
+
+
+def run_sites(config_path, workers=None, resume=False, configure=None, profiled=None):
+    """Crawl every site of a sites.json config concurrently: one thread per site, shared connection
+    pool and a global budget of concurrent fetches; return the new post count of every site entry in
+    config order (None for a site that failed or did not finish), or [] for an invalid config
+    
+    Each site entry needs "url" and may set "name" (default: host, port and path of the url),
+    "output_dir" (relative to the config file, default: the name),
+    "max_pages", "posts_per_page", "post_delay", "page_delay", "sitemap" and "selectors"
+    ({"article", "content"}).
+    configure(scraper) is called for every site scraper before the crawl starts. profiled(func, label)
+    (see run_profiled) wraps each site's crawl inside its own thread, since profilers only see the
+    thread they run in.
+    """
+    import requests
+    
+    try:
+        config = load_json(config_path)
+    except (OSError, ValueError) as e:
+        logger.error("❌ Gagal membaca %s: %s", config_path, e)
+        return []
+    sites = (config.get('sites') if isinstance(config, dict) else None) or []
+    if not sites or not all(site.get('url') for site in sites):
+        logger.error("❌ %s harus berisi daftar 'sites' dan setiap site harus punya 'url'", config_path)
+        return []
+    
+    base_dir = os.path.dirname(os.path.abspath(config_path))
+    names = [site.get('name') or default_site_name(site['url']) for site in sites]
+    output_dirs = [os.path.normpath(os.path.join(base_dir, site.get('output_dir', name))) for site, name in zip(sites, names)]
+    # Dua site dengan store/checkpoint yang sama akan saling menimpa file
+    for label, values in (('name', names), ('output_dir', output_dirs)):
+        duplicates = sorted({value for value in values if values.count(value) > 1})
+        if duplicates:
+            logger.error("❌ %s: %s dipakai lebih dari satu site: %s", config_path, label, ', '.join(duplicates))
+            return []
+    workers = workers or config.get('workers') or min(len(sites), DEFAULT_SITE_WORKERS)
+    # Slot fetch dibagi FIFO: site yang baru selesai fetch antre di belakang site yang sudah menunggu
+    slots = FetchSlots(workers)
+    adapter = requests.adapters.HTTPAdapter(pool_connections=len(sites), pool_maxsize=workers)
+    
+    results = [None] * len(sites)  # (count, elapsed) per entry config
+    threads = []
+    for index, (site, name, output_dir) in enumerate(zip(sites, names, output_dirs)):
+        scraper = BlogScraper(site['url'], site.get('max_pages'), site.get('posts_per_page'), output_dir=output_dir)
+        scraper.selectors = site.get('selectors') or {}
+        scraper.post_delay = site.get('post_delay', scraper.post_delay)
+        scraper.page_delay = site.get('page_delay', scraper.page_delay)
+        scraper.fetch_slots = slots
+        scraper.sitemap_url = site.get('sitemap')
+        scraper.session.mount('http://', adapter)
+        scraper.session.mount('https://', adapter)
+        if configure:
+            configure(scraper)
+        threads.append(threading.Thread(target=_run_site, args=(index, name, scraper, resume, results, profiled), name=name, daemon=True))
+    
+    logger.info("🌐 Scraping %d site dengan %d fetch bersamaan", len(threads), workers)
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        logger.warning("⏸️  Scraping dihentikan. Progress tiap site tersimpan di checkpoint-nya, lanjutkan dengan --resume")
+        return [result and result[0] for result in results]
+    
+    logger.info("🏁 %d site selesai dalam %.1f detik", len(threads), time.perf_counter() - started)
+    for name, (count, elapsed) in zip(names, results):
+        if count is None:
+            logger.info("  ❌ %s: gagal (%.1f detik)", name, elapsed)
+        else:
+            logger.info("  ✅ %s: %d post baru (%.1f detik)", name, count, elapsed)
+    return [count for count, elapsed in results]
+
+
+def default_site_name(url):
+    """Site name (and default output folder) from host, port and path, e.g. contoh.co.id-8080-blog"""
+    parsed = urlparse(url)
+    parts = [parsed.hostname or 'site', str(parsed.port or '')] + parsed.path.split('/')
+    return '-'.join(re.sub(r'[^\w.-]+', '-', part).strip('-') for part in parts if part.strip('-/'))
+
+
+def sitemap_url(base_url, value):
+    """Resolve a --sitemap value: 'auto' means /sitemap.xml on the blog's domain"""
+    return urljoin(base_url, '/sitemap.xml') if value == 'auto' else value
 
 
-def get_db_credentials():
+def _run_site(index, name, scraper, resume, results, profiled=None):
+    started = time.perf_counter()
+    crawl = lambda: sum(1 for _ in scraper.iter_posts(resume=resume))
+    try:
+        count = profiled(crawl, f'site-{name}') if profiled else crawl()
+    except Exception as e:
+        logger.error("❌ Site %s gagal: %s", name, e, exc_info=logger.isEnabledFor(logging.DEBUG), extra={'url': scraper.base_url})
+        count = None
+    results[index] = (count, time.perf_counter() - started)
+
+
+def get_db_credentials(interactive=True):
     """Get database credentials from user input or config file"""
     config_file = 'db_config.json'
     
@@ -867,6 +1920,8 @@ def get_db_credentials():
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
                 config = json.load(f)
+                if not interactive:
+                    return config
                 print(f"✅ Menggunakan konfigurasi dari {config_file}")
                 use_saved = input("Gunakan konfigurasi yang tersimpan? (y/n, default: y): ").strip().lower()
                 if use_saved != 'n':
@@ -874,6 +1929,9 @@ def get_db_credentials():
         except Exception as e:
             print(f"⚠️  Error membaca {config_file}: {e}")
     
+    if not interactive:
+        return None
+    
     # Jika tidak ada atau user ingin input baru, minta input dari user
     print("\n" + "=" * 60)
     print("📊 Konfigurasi Database")
@@ -914,14 +1972,15 @@ def get_db_credentials():
 
 def fetch_from_database(config):
     """Fetch posts from database"""
-    if not HAS_MYSQL:
+    mysql_connector = _optional_import('mysql.connector')
+    if mysql_connector is None:
         print("❌ mysql-connector-python tidak terinstall!")
         print("Install dengan: pip install mysql-connector-python")
         return []
     
     try:
-        print(f"\n🔌 Menghubungkan ke database {config['database']}...")
-        connection = mysql.connector.connect(
+        logger.info("\n🔌 Menghubungkan ke database %s...", config['database'])
+        connection = mysql_connector.connect(
             host=config['host'],
             port=config['port'],
             database=config['database'],
@@ -949,7 +2008,7 @@ def fetch_from_database(config):
             cursor.execute(query)
             posts = cursor.fetchall()
             
-            print(f"✅ Berhasil mengambil {len(posts)} posts dari database")
+            logger.info("✅ Berhasil mengambil %d posts dari database", len(posts))
             
             # Convert ke format yang sama dengan scraping
             formatted_posts = []
@@ -973,22 +2032,485 @@ def fetch_from_database(config):
                     'categories': [],  # TODO: bisa diisi dari pivot table jika ada
                     'tags': [],  # TODO: bisa diisi dari pivot table jika ada
                 }
-                formatted_posts.append(formatted_post)
+                formatted_posts.append(PostRecord.from_dict(formatted_post))
             
             cursor.close()
             connection.close()
             
             return formatted_posts
             
-    except Error as e:
-        print(f"❌ Error koneksi database: {e}")
+    except mysql_connector.Error as e:
+        logger.error("❌ Error koneksi database: %s", e)
         return []
     except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error("❌ Error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return []
 
+def parse_lastmod(value):
+    """Parse a W3C datetime or date (sitemap <lastmod>, PostRecord.fetched_at) into a Unix timestamp, None if invalid"""
+    if not value:
+        return None
+    try:
+        # fromisoformat sebelum Python 3.11 tidak menerima akhiran Z
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+def _orjson():
+    # orjson opsional (tanpa warning): jika tidak ada, modul json standar dipakai
+    return _optional_import('orjson')
+
+
+def load_json(path):
+    """Parse a JSON file with orjson when installed, else the stdlib json module"""
+    orjson = _orjson()
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dumps_json(data, compact=False):
+    """Serialize to UTF-8 JSON bytes, indented like json.dump(indent=2) unless compact"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def dump_json(data, path, compact=False):
+    """Write JSON atomically (temp file + rename), so a crash never leaves a truncated store"""
+    _write_atomic(path, dumps_json(data, compact))
+
+
+def store_index_path(store_path):
+    root, _ = os.path.splitext(store_path)
+    return root + '.index.json'
+
+
+def _store_signature(store_path):
+    stat = os.stat(store_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def write_store_index(store_path, posts):
+    """Write the sidecar slug/thumbnail index for store_path and return it"""
+    index = dict(
+        _store_signature(store_path),
+        slugs=[post['slug'] for post in posts if post.get('slug')],
+        images=[post['thumbnail_path'] for post in posts if post.get('thumbnail_path')],
+        fetched={post['slug']: post['fetched_at'] for post in posts if post.get('slug') and post.get('fetched_at')},
+    )
+    _write_atomic(store_index_path(store_path), dumps_json(index, compact=True))
+    return index
+
+
+def read_store_index(store_path):
+    """Return the sidecar index if it still matches the store's size and mtime, else None"""
+    try:
+        index = load_json(store_index_path(store_path))
+        if {key: index.get(key) for key in ('size', 'mtime_ns')} == _store_signature(store_path):
+            return index
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def store_journal_path(store_path):
+    root, _ = os.path.splitext(store_path)
+    return root + '.pending.jsonl'
+
+
+def compact_store(store_path, source_url=None):
+    """Merge the append-only journal of saved pages into the store, rewrite its index and drop the journal
+    
+    New slugs are appended, refreshes replace the stored post in place and other duplicates are
+    ignored. Returns the merged store data, or None when there is no journal to merge.
+    """
+    journal_path = store_journal_path(store_path)
+    if not os.path.exists(journal_path):
+        return None
+    
+    data = {'version': '1.0', 'scraped_at': None, 'source_url': source_url, 'total': 0, 'posts': []}
+    if os.path.exists(store_path):
+        try:
+            data = load_json(store_path)
+        except Exception as e:
+            # Store rusak tidak boleh hilang tertimpa: biarkan journal untuk dicoba lagi
+            logger.error("❌ Gagal membaca %s, journal tidak digabung: %s", store_path, e)
+            return None
+    merged_posts = data.get('posts') or []
+    positions = {post.get('slug'): i for i, post in enumerate(merged_posts) if post.get('slug')}
+    
+    added = 0
+    refreshed = 0
+    with open(journal_path, 'rb') as f:
+        for line in f:
+            try:
+                entry = (_orjson() or json).loads(line)
+            except ValueError:
+                break  # Baris terakhir terpotong (crash saat menulis)
+            post = entry['post']
+            slug = post.get('slug')
+            if slug in positions:
+                if entry.get('refresh'):
+                    merged_posts[positions[slug]] = post
+                    refreshed += 1
+                continue
+            positions[slug] = len(merged_posts)
+            merged_posts.append(post)
+            added += 1
+    
+    data.update(scraped_at=datetime.now().isoformat(), total=len(merged_posts), posts=merged_posts)
+    # Store lokal dengan body terkompresi (bukan file import Laravel) tidak perlu pretty-print
+    dump_json(data, store_path, compact=any(post.get('body_encoding') for post in merged_posts))
+    write_store_index(store_path, merged_posts)
+    # Journal baru dihapus setelah store aman; jika crash di antaranya, menggabung ulang hasilnya sama
+    os.remove(journal_path)
+    
+    logger.info("💾 Data JSON disimpan: %d total posts (%d baru ditambahkan)", len(merged_posts), added)
+    if refreshed:
+        logger.info("🔁 %d posts diperbarui dari versi terbaru", refreshed)
+    return data
+
+
+def accepted_encodings():
+    """Content encodings the installed urllib3 can actually decode (its own ACCEPT_ENCODING list)"""
+    # urllib3 menentukan sendiri decoder br/zstd yang dipakai (mis. zstd butuh backports.zstd sebelum
+    # Python 3.14, bukan zstandard), jadi jangan tebak dari nama paket
+    from urllib3.util.request import ACCEPT_ENCODING
+    return [encoding.strip() for encoding in ACCEPT_ENCODING.split(',')]
+
+
+def encode_body(body, codec):
+    """Compress an HTML body with gzip or zstd and return it as base64 text for the JSON store"""
+    import base64
+    raw = body.encode('utf-8')
+    if codec == 'zstd':
+        import zstandard
+        packed = zstandard.ZstdCompressor(level=10).compress(raw)
+    else:
+        import gzip
+        packed = gzip.compress(raw, compresslevel=9)
+    return base64.b64encode(packed).decode('ascii')
+
+
+def decode_body(post):
+    """Return the post dict with its body decompressed (no-op for plain bodies)"""
+    codec = post.get('body_encoding')
+    if not codec:
+        return post
+    import base64
+    packed = base64.b64decode(post['body'])
+    if codec == 'zstd':
+        import zstandard
+        raw = zstandard.ZstdDecompressor().decompress(packed)
+    else:
+        import gzip
+        raw = gzip.decompress(packed)
+    post = dict(post)
+    post['body'] = raw.decode('utf-8')
+    del post['body_encoding']
+    return post
+
+
+def export_laravel(store_path, output_path, chunk_size=None, workers=None):
+    """Write the Laravel import file from the local store, decompressing bodies
+    
+    With chunk_size, output_path is a directory that receives posts-NNNNN.json files of at most
+    chunk_size posts each plus a manifest.json listing file names, counts and SHA-256 checksums.
+    """
+    data = compact_store(store_path) or load_json(store_path)
+    data['posts'] = [decode_body(post) for post in data.get('posts', [])]
+    data['total'] = len(data['posts'])
+    
+    if chunk_size:
+        return _export_chunks(data, output_path, chunk_size, workers)
+    
+    dump_json(data, output_path)
+    logger.info("📤 Export Laravel: %d posts -> %s", data['total'], output_path)
+    return data['total']
+
+
+def _export_chunks(data, directory, chunk_size, workers=None):
+    # Setiap export menulis chunk ke folder generasi baru, jadi chunk yang masih dirujuk manifest lama
+    # tidak pernah ditimpa; manifest baru lalu menggantikan yang lama secara atomik
+    generation = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+    os.makedirs(os.path.join(directory, generation), exist_ok=True)
+    posts = data['posts']
+    header = {key: value for key, value in data.items() if key not in ('posts', 'total')}
+    jobs = []
+    for number, start in enumerate(range(0, len(posts), chunk_size), 1):
+        jobs.append((directory, f"{generation}/posts-{number:05d}.json", header, posts[start:start + chunk_size]))
+    
+    if workers and workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_write_export_chunk, jobs))
+    else:
+        chunks = [_write_export_chunk(job) for job in jobs]
+    
+    # Importer yang sudah membaca manifest sebelumnya masih boleh mengambil chunk-nya: generasi itu
+    # dipertahankan sampai export berikutnya
+    manifest_path = os.path.join(directory, 'manifest.json')
+    try:
+        previous = load_json(manifest_path).get('generation', 'legacy')
+    except (OSError, ValueError, AttributeError):
+        previous = None
+    
+    # Manifest ditulis setelah semua chunk, jadi importer tidak pernah melihat daftar chunk yang belum lengkap
+    manifest = dict(header, exported_at=datetime.now().isoformat(), generation=generation, total=len(posts),
+                    chunk_size=chunk_size, chunks=chunks)
+    _write_atomic(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+    
+    # Baru setelah manifest baru aktif: hapus generasi yang lebih tua dari manifest sebelumnya (dan chunk
+    # format lama di folder utama, kecuali manifest sebelumnya masih format lama)
+    import shutil
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if re.fullmatch(r'\d{8}-\d{6}-\d{6}', name) and name not in (generation, previous) and os.path.isdir(path):
+            shutil.rmtree(path)
+        elif re.fullmatch(r'posts-\d{5}\.json', name) and previous != 'legacy':
+            os.remove(path)
+    logger.info("📤 Export Laravel: %d posts dalam %d chunk -> %s", len(posts), len(chunks), directory)
+    return len(posts)
+
+
+def _write_export_chunk(job):
+    directory, name, header, posts = job
+    payload = dict(header, total=len(posts), posts=posts)
+    raw = dumps_json(payload)
+    _write_atomic(os.path.join(directory, *name.split('/')), raw)
+    import hashlib
+    return {
+        'file': name,
+        'count': len(posts),
+        'bytes': len(raw),
+        'sha256': hashlib.sha256(raw).hexdigest(),
+        'first_slug': posts[0].get('slug') if posts else None,
+        'last_slug': posts[-1].get('slug') if posts else None,
+    }
+
+
+def _write_atomic(path, raw):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(raw)
+    os.replace(tmp_path, path)
+
+
+# Kolom tabel posts Laravel yang diisi oleh MySQLSink (slug harus UNIQUE untuk upsert)
+POST_COLUMNS = (
+    'title', 'slug', 'type', 'excerpt', 'body', 'price', 'thumbnail_path', 'og_image', 'status',
+    'is_featured', 'published_at', 'redirect_url', 'meta_title', 'meta_description', 'meta_keywords',
+)
+
+
+# Kolom yang ditimpa saat slug sudah ada: hanya konten hasil scraping. Kolom editorial (status,
+# published_at, is_featured, price, redirect_url, meta_*) bisa sudah diubah editor di Laravel.
+UPSERT_UPDATE_COLUMNS = ('title', 'excerpt', 'body', 'thumbnail_path', 'updated_at')
+
+
+class MySQLSink:
+    """Write scraped posts straight into the posts table with batched upserts on slug"""
+    
+    def __init__(self, config, batch_size=200, pool_size=2):
+        mysql_connector = _optional_import('mysql.connector', 'mysql-connector-python')
+        if mysql_connector is None:
+            raise RuntimeError("mysql-connector-python tidak terinstall")
+        from mysql.connector import pooling
+        
+        self.table = config.get('table_name') or 'posts'
+        if not re.fullmatch(r'\w+', self.table):
+            raise ValueError(f"Nama tabel tidak valid: {self.table}")
+        self.batch_size = batch_size
+        self.pool = pooling.MySQLConnectionPool(
+            pool_name='scrape_blog',
+            pool_size=pool_size,
+            host=config['host'],
+            port=config['port'],
+            database=config['database'],
+            user=config['username'],
+            password=config['password'],
+            charset='utf8mb4',
+        )
+        
+        columns = POST_COLUMNS + ('created_at', 'updated_at')
+        updates = ', '.join(f"`{col}` = VALUES(`{col}`)" for col in UPSERT_UPDATE_COLUMNS)
+        self.sql = (
+            f"INSERT INTO `{self.table}` ({', '.join(f'`{col}`' for col in columns)}) "
+            f"VALUES ({', '.join(['%s'] * len(columns))}) "
+            f"ON DUPLICATE KEY UPDATE {updates}"
+        )
+    
+    def existing_slugs(self):
+        """Slugs already in the table, used for dedup when JSON output is off"""
+        connection = self.pool.get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(f"SELECT slug FROM `{self.table}` WHERE type = 'post'")
+            slugs = {row[0] for row in cursor.fetchall()}
+            cursor.close()
+            return slugs
+        finally:
+            connection.close()  # Kembali ke pool
+    
+    def write(self, posts):
+        """Upsert posts in chunks of batch_size, one transaction per chunk; return rows written"""
+        now = datetime.now()
+        rows = [self._row(post.to_dict(), now) for post in posts if post.slug]
+        if not rows:
+            return 0
+        
+        connection = self.pool.get_connection()
+        try:
+            cursor = connection.cursor()
+            for start in range(0, len(rows), self.batch_size):
+                chunk = rows[start:start + self.batch_size]
+                try:
+                    cursor.executemany(self.sql, chunk)
+                    connection.commit()
+                except Exception as e:
+                    connection.rollback()
+                    logger.error("❌ Gagal upsert %d posts ke %s: %s", len(chunk), self.table, e)
+                    raise
+            cursor.close()
+        finally:
+            connection.close()  # Kembali ke pool
+        
+        logger.info("🗄️  %d posts di-upsert ke tabel %s", len(rows), self.table)
+        return len(rows)
+    
+    @staticmethod
+    def _row(post, now):
+        values = []
+        for col in POST_COLUMNS:
+            value = post.get(col)
+            if col == 'is_featured':
+                value = int(bool(value))
+            elif col == 'published_at' and value:
+                value = datetime.fromisoformat(value)
+            values.append(value)
+        return tuple(values) + (now, now)
+
+# Fungsi yang totalnya dilaporkan setelah run yang di-profile
+PROFILE_TARGETS = ('extract_post_data', 'clean_html', 'download_image')
+
+
+class SamplingProfiler:
+    """Low-overhead sampling profiler: snapshots one thread's stack from a background thread"""
+
+    def __init__(self, interval=0.005, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.stacks = Counter()  # collapsed stack (root;...;leaf) -> jumlah sample
+        self.samples = 0
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self.elapsed = time.perf_counter() - self._started
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def write_collapsed(self, path):
+        """Write stacks in collapsed format (input for flamegraph.pl / speedscope)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def function_totals(self, names):
+        """Inclusive sample count and estimated wall seconds per function name"""
+        totals = {name: 0 for name in names}
+        for stack, count in self.stacks.items():
+            funcs = {frame.split(' (', 1)[0] for frame in stack.split(';')}
+            for name in names:
+                if name in funcs:
+                    totals[name] += count
+        # Sample bisa tertunda oleh GIL, jadi detik diestimasi dari proporsi sample terhadap durasi run
+        per_sample = self.elapsed / self.samples if self.samples else 0.0
+        return {name: {'samples': n, 'seconds': round(n * per_sample, 3)} for name, n in totals.items()}
+
+
+def _pstats_totals(stats, names):
+    """Aggregate calls/tottime/cumtime per function name from a pstats.Stats"""
+    totals = {name: {'calls': 0, 'tottime': 0.0, 'cumtime': 0.0} for name in names}
+    for (filename, line, funcname), (cc, nc, tt, ct, callers) in stats.stats.items():
+        if funcname in totals:
+            totals[funcname]['calls'] += nc
+            totals[funcname]['tottime'] += tt
+            totals[funcname]['cumtime'] += ct
+    for entry in totals.values():
+        entry['tottime'] = round(entry['tottime'], 3)
+        entry['cumtime'] = round(entry['cumtime'], 3)
+    return totals
+
+
+def run_profiled(func, mode=None, out_dir='profiles', label='scrape', interval=0.005):
+    """Run func() optionally under cProfile or the sampling profiler, dumping results per run"""
+    if not mode:
+        return func()
+    
+    os.makedirs(out_dir, exist_ok=True)
+    base = os.path.join(out_dir, f"{label}-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+    
+    if mode == 'cprofile':
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func)
+        finally:
+            path = base + '.pstats'
+            profiler.dump_stats(path)
+            totals = _pstats_totals(pstats.Stats(profiler), PROFILE_TARGETS)
+            _write_profile_totals(base, path, totals)
+    else:
+        sampler = SamplingProfiler(interval)
+        sampler.start()
+        try:
+            return func()
+        finally:
+            sampler.stop()
+            path = base + '.collapsed'
+            sampler.write_collapsed(path)
+            totals = sampler.function_totals(PROFILE_TARGETS)
+            _write_profile_totals(base, path, totals)
+
+
+def _write_profile_totals(base, path, totals):
+    with open(base + '.totals.json', 'w', encoding='utf-8') as f:
+        json.dump(totals, f, indent=2)
+    logger.info("⏱️  Profil disimpan: %s", path, extra={'profile': path})
+    for name, entry in totals.items():
+        logger.info("   %s: %s", name, ', '.join(f"{k}={v}" for k, v in entry.items()), extra={'function': name, 'totals': entry})
+
 def show_menu():
     """Show interactive menu"""
     print("\n" + "="*60)
@@ -1017,15 +2539,101 @@ def main():
     parser.add_argument('--posts-per-page', type=int, default=None, help='Jumlah posts per halaman')
     parser.add_argument('--all', action='store_true', help='Scrape semua halaman tanpa limit')
     parser.add_argument('--non-interactive', action='store_true', help='Non-interactive mode (use arguments)')
+    parser.add_argument('--resume', action='store_true', help='Lanjutkan crawl yang terhenti dari checkpoint terakhir')
+    parser.add_argument('--chunk-size', type=int, default=None, help='Export Laravel dalam file-file berisi N posts + manifest.json (PATH --export-laravel menjadi folder)')
+    parser.add_argument('--archive', action='store_true', help='Simpan HTML mentah setiap halaman di folder archive/ (untuk --reextract)')
+    parser.add_argument('--reextract', action='store_true', help='Ekstrak ulang body semua post dari archive/ tanpa network, lalu keluar')
+    parser.add_argument('--workers', type=int, default=None, help='Jumlah proses untuk --reextract dan export chunk (default: jumlah CPU / tanpa paralel), atau jumlah fetch bersamaan untuk --sites')
+    parser.add_argument('--time-budget', type=float, default=None, help='Berhenti rapi setelah N detik; sisa antrian disimpan di checkpoint untuk --resume')
+    parser.add_argument('--sitemap', metavar='URL', nargs='?', const='auto', default=None, help='Pakai lastmod sitemap (default: <domain>/sitemap.xml) untuk prioritas fetch dan refresh post yang berubah')
+    parser.add_argument('--sites', metavar='FILE', default=None, help='Scrape beberapa blog sekaligus dari file konfigurasi (mis. sites.json), satu thread per site')
+    parser.add_argument('--watch', action='store_true', help='Mode resident: cek halaman pertama secara berkala dan scrape hanya post baru')
+    parser.add_argument('--watch-interval', type=int, default=300, help='Interval poll mode watch dalam detik (default: 300)')
+    parser.add_argument('--max-page-bytes', type=int, default=DEFAULT_MAX_PAGE_BYTES, help=f'Batas ukuran halaman dalam bytes, halaman lebih besar dilewati (default: {DEFAULT_MAX_PAGE_BYTES}, 0 = tanpa batas)')
+    parser.add_argument('--compress-bodies', choices=['gzip', 'zstd'], default=None, help='Simpan body terkompresi di scraped_posts.json (gunakan --export-laravel untuk file import)')
+    parser.add_argument('--export-laravel', metavar='FILE', nargs='?', const='scraped_posts_laravel.json', default=None, help='Buat file import Laravel (body didekompresi) dari scraped_posts.json lalu keluar')
+    parser.add_argument('--output', choices=['json', 'db', 'both'], default='json', help='Tujuan output: json (default), db (upsert langsung ke tabel posts, config dari db_config.json), atau both')
+    parser.add_argument('--db-batch-size', type=int, default=200, help='Jumlah baris per executemany/transaksi untuk output db (default: 200)')
+    parser.add_argument('--log-format', choices=['text', 'json'], default='text', help='Format log: text (default) atau json (satu objek per baris)')
+    parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], default='INFO', help='Level log minimum (default: INFO)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Tampilkan log per artikel (sama dengan --log-level DEBUG)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Hanya tampilkan warning dan error')
+    parser.add_argument('--progress', action='store_true', help='Tampilkan progress bar, log hanya warning dan error')
+    parser.add_argument('--profile', choices=['cprofile', 'sample'], default=None, help='Profile scraping/export: cprofile (.pstats) atau sample (.collapsed untuk flamegraph)')
+    parser.add_argument('--profile-dir', default='profiles', help='Folder output profil (default: profiles)')
+    parser.add_argument('--profile-interval', type=float, default=5.0, help='Interval sampling dalam milidetik (default: 5)')
     
     args = parser.parse_args()
     
+    log_level = getattr(logging, args.log_level)
+    if args.verbose:
+        log_level = logging.DEBUG
+    elif args.quiet or args.progress:
+        log_level = max(log_level, logging.WARNING)
+    progress = setup_logging(args.log_format, log_level, progress=args.progress and not args.sites, threads=bool(args.sites))
+    
+    def profiled(func, label):
+        return run_profiled(func, args.profile, args.profile_dir, label, args.profile_interval / 1000.0)
+    
+    if args.compress_bodies == 'zstd' and _optional_import('zstandard', 'zstandard') is None:
+        sys.exit(1)
+    
+    archive_dir = os.path.join(os.path.dirname(__file__), 'archive')
+    if args.reextract:
+        scraper = BlogScraper(args.url)
+        scraper.archive = HtmlArchive(archive_dir)
+        scraper.compress_bodies = args.compress_bodies
+        profiled(lambda: scraper.reextract(args.workers), 'reextract')
+        return
+    
+    if args.export_laravel or args.chunk_size:
+        store_path = os.path.join(os.path.dirname(__file__), 'scraped_posts.json')
+        output_path = args.export_laravel or 'scraped_posts_laravel.json'
+        if args.chunk_size and output_path.endswith('.json'):
+            output_path = output_path[:-len('.json')]
+        profiled(lambda: export_laravel(store_path, output_path, args.chunk_size, args.workers), 'export')
+        return
+    
+    if args.sites:
+        def configure(scraper):
+            scraper.max_page_bytes = args.max_page_bytes
+            scraper.compress_bodies = args.compress_bodies
+            scraper.time_budget = args.time_budget
+            if args.sitemap and not scraper.sitemap_url:
+                scraper.sitemap_url = sitemap_url(scraper.base_url, args.sitemap)
+            if args.archive:
+                scraper.archive = HtmlArchive(os.path.join(os.path.dirname(scraper.json_path), 'archive'))
+        if args.profile == 'cprofile' and sys.version_info >= (3, 12):
+            # cProfile 3.12+ (sys.monitoring) sudah melihat semua thread, tapi hanya satu profiler boleh aktif
+            results = profiled(lambda: run_sites(args.sites, args.workers, args.resume, configure), 'sites')
+        else:
+            results = run_sites(args.sites, args.workers, args.resume, configure, profiled)
+        sys.exit(0 if results and None not in results else 1)
+    
     # If non-interactive or arguments provided, use arguments
-    if args.non_interactive or any([args.max_pages is not None, args.posts_per_page is not None, args.all]):
+    if args.non_interactive or args.resume or args.watch or args.output != 'json' or args.time_budget or args.sitemap or any([args.max_pages is not None, args.posts_per_page is not None, args.all]):
         max_pages = None if args.all else args.max_pages
         posts_per_page = None if args.posts_per_page == 0 else args.posts_per_page
         scraper = BlogScraper(args.url, max_pages, posts_per_page)
-        scraper.scrape()
+        scraper.progress = progress
+        scraper.max_page_bytes = args.max_page_bytes
+        scraper.compress_bodies = args.compress_bodies
+        scraper.output = args.output
+        scraper.time_budget = args.time_budget
+        if args.sitemap:
+            scraper.sitemap_url = sitemap_url(args.url, args.sitemap)
+        if args.archive:
+            scraper.archive = HtmlArchive(archive_dir)
+        if args.output != 'json':
+            config = get_db_credentials(interactive=False)
+            if not config:
+                logger.error("❌ Output db membutuhkan db_config.json (jalankan menu 'Import dari Database' sekali untuk membuatnya)")
+                sys.exit(1)
+            scraper.db_sink = MySQLSink(config, batch_size=args.db_batch_size)
+        if args.watch:
+            profiled(lambda: scraper.watch(args.watch_interval), 'watch')
+        else:
+            profiled(lambda: scraper.scrape(resume=args.resume), 'scrape')
         return
     
     # Interactive mode
@@ -1042,11 +2650,17 @@ def main():
                 print("❌ Konfigurasi database tidak lengkap!")
                 continue
             
-            posts = fetch_from_database(config)
+            def export_database():
+                posts = fetch_from_database(config)
+                if posts:
+                    scraper = BlogScraper(args.url)
+                    scraper.posts = posts
+                    scraper.save_to_json()
+                    scraper.compact_store()
+                return posts
+            
+            posts = profiled(export_database, 'db-export')
             if posts:
-                scraper = BlogScraper(args.url)
-                scraper.posts = posts
-                scraper.save_to_json()
                 print(f"\n✅ {len(posts)} posts berhasil di-export ke JSON!")
                 print(f"📁 File: scraped_posts.json")
             else:
@@ -1067,7 +2681,15 @@ def main():
         if choice in ['1', '2']:
             print("\n" + "="*60)
             scraper = BlogScraper(args.url, max_pages, posts_per_page)
-            scraper.scrape()
+            scraper.progress = progress
+            scraper.max_page_bytes = args.max_page_bytes
+            scraper.compress_bodies = args.compress_bodies
+            if args.archive:
+                scraper.archive = HtmlArchive(archive_dir)
+            resume = False
+            if os.path.exists(scraper.checkpoint.path):
+                resume = input("Ditemukan crawl yang terhenti. Lanjutkan? (y/n, default: y): ").strip().lower() != 'n'
+            profiled(lambda: scraper.scrape(resume=resume), 'scrape')
             
             # Ask if want to continue (only for per-page mode)
             if choice == '2':
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# scrape_blog.py adalah script tunggal di root repo, bukan package yang di-install
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
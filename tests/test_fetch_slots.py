@@ -0,0 +1,39 @@
+"""FetchSlots hands slots out in arrival order: a thread that releases and asks again queues behind waiters"""
+
+import threading
+import time
+
+import scrape_blog
+
+
+def test_released_slot_goes_to_longest_waiter():
+    slots = scrape_blog.FetchSlots(1)
+    order = []
+    slots.acquire()
+
+    def wait_turn(name):
+        with slots:
+            order.append(name)
+
+    threads = []
+    for name in ('a', 'b', 'c'):
+        thread = threading.Thread(target=wait_turn, args=(name,))
+        thread.start()
+        threads.append(thread)
+        while len(slots._waiters) < len(threads):
+            time.sleep(0.001)
+
+    # Pemegang slot langsung meminta lagi: harus antre di belakang a, b dan c
+    slots.release()
+    with slots:
+        order.append('owner')
+    for thread in threads:
+        thread.join(timeout=5)
+    assert order == ['a', 'b', 'c', 'owner']
+
+
+def test_free_slots_do_not_block():
+    slots = scrape_blog.FetchSlots(2)
+    with slots, slots:
+        assert slots._free == 0
+    assert slots._free == 2
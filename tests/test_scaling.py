@@ -0,0 +1,124 @@
+"""Scaling regression test for load / dedup / save with synthetic stores of growing size
+
+Time is compared between sizes: a 10x larger store may be at most MAX_GROWTH x 10 slower
+(linear ~1x, quadratic ~10x). Peak tracemalloc memory per post is capped per phase.
+Sizes can be overridden with SCRAPE_BENCH_SIZES=1000,10000 for a quicker run.
+"""
+
+import logging
+import os
+import time
+import tracemalloc
+
+import pytest
+
+import scrape_blog
+
+SIZES = tuple(int(size) for size in os.environ.get('SCRAPE_BENCH_SIZES', '1000,10000,100000').split(','))
+MAX_GROWTH = 3.0
+MIN_SECONDS = 0.01  # Waktu di bawah ini dianggap noise saat menghitung growth
+# Peak tracemalloc maksimal per post (bytes), body sintetis BODY_SIZE karakter.
+# Load hanya membaca sidecar index dan save hanya menambah journal (keduanya tanpa body): batas save
+# di bawah BODY_SIZE, jadi save yang membaca ulang seluruh store pasti gagal.
+BODY_SIZE = 512
+MAX_PEAK_PER_POST = {'load': 1024, 'dedup': 16384, 'save': BODY_SIZE // 2}
+PHASES = tuple(MAX_PEAK_PER_POST)
+
+
+def make_post(i):
+    return scrape_blog.PostRecord(
+        title=f"Post sintetis {i}",
+        slug=f"post-sintetis-{i}",
+        url=f"https://example.com/blog/post-sintetis-{i}",
+        excerpt=f"Ringkasan post sintetis nomor {i}",
+        thumbnail_path=f"images/post-sintetis-{i}.jpg",
+        categories=['Umum'],
+        tags=['lanyard', 'bench'],
+        body='<p>' + ('x' * BODY_SIZE) + '</p>',
+        fetched_at='2025-01-01T00:00:00+07:00',
+    )
+
+
+def make_listing(numbers):
+    articles = ''.join(
+        f'<article><h2><a href="/blog/post-sintetis-{i}">Post sintetis {i}</a></h2><p>Ringkasan {i}</p></article>'
+        for i in numbers
+    )
+    return f'<html><body>{articles}</body></html>'.encode('utf-8')
+
+
+def measure(func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        func()
+    finally:
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def run_size(directory, size):
+    scraper = scrape_blog.BlogScraper('https://example.com/blog', output_dir=str(directory))
+    
+    # Store awal berisi `size` posts
+    scraper.posts = [make_post(i) for i in range(size)]
+    scraper.save_to_json()
+    scraper.compact_store()
+    scraper.posts = []
+    
+    state = {}
+    load = measure(lambda: state.update(index=scraper.load_existing_posts()))
+    existing_slugs = state['index'][0]
+    
+    # Listing sintetis: setengah post sudah ada, ditambah duplikat di halaman yang sama
+    listing = make_listing([*range(size - size // 200, size + size // 200), *range(size, size + size // 200)])
+    
+    # Dedup lewat loop filter iter_posts yang sebenarnya; fetch listing/detail di-stub (tanpa jaringan)
+    scraper.max_pages, scraper.posts_per_page = 1, None
+    scraper.post_delay = scraper.page_delay = 0
+    scraper.fetch_html = lambda url, conditional=False: listing
+    scraper.process_post = lambda post: True
+    
+    def dedup():
+        state['new'] = list(scraper.iter_posts(persist=False, existing_slugs=existing_slugs))
+    dedup_result = measure(dedup)
+    assert len(state['new']) == size // 200  # Duplikat di halaman yang sama ikut tersaring
+    
+    scraper.posts = [make_post(size + i) for i in range(len(state['new']))]
+    save = measure(scraper.save_to_json)
+    return {'load': load, 'dedup': dedup_result, 'save': save}
+
+
+@pytest.fixture(scope='module')
+def results(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp('scaling')
+    logging.disable(logging.INFO)
+    try:
+        # Pemanasan: import bs4/orjson dan parser pertama kali tidak boleh masuk ke ukuran terkecil
+        run_size(tmp_path / 'warmup', min(SIZES))
+        
+        measured = {size: run_size(tmp_path / str(size), size) for size in SIZES}
+    finally:
+        logging.disable(logging.NOTSET)
+    for size, phases in measured.items():
+        print(f"{size:7d} posts | " + ' | '.join(
+            f"{phase} {seconds:.3f}s {peak / 1024:.1f} KB" for phase, (seconds, peak) in phases.items()))
+    return measured
+
+
+@pytest.mark.parametrize('phase', PHASES)
+def test_peak_memory_per_post(results, phase):
+    for size in SIZES:
+        per_post = results[size][phase][1] / size
+        assert per_post <= MAX_PEAK_PER_POST[phase], f"{phase} @ {size} posts: {per_post:.0f} bytes/post"
+
+
+@pytest.mark.parametrize('phase', PHASES)
+def test_time_grows_linearly(results, phase):
+    for smaller, larger in zip(SIZES, SIZES[1:]):
+        before = max(results[smaller][phase][0], MIN_SECONDS)
+        after = max(results[larger][phase][0], MIN_SECONDS)
+        growth = (after / before) / (larger / smaller)
+        assert growth <= MAX_GROWTH, f"{phase}: {smaller} -> {larger} posts tumbuh {growth:.1f}x lebih cepat dari linear"
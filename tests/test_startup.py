@@ -0,0 +1,56 @@
+"""Startup budget: `scrape_blog.py --help` must stay cheap for cron / health checks
+
+requests, bs4, dateutil and mysql.connector are imported lazily; this test fails when one of them is
+imported at startup again or when startup overhead over a bare interpreter exceeds BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scrape_blog.py')
+BUDGET_MS = 100
+HEAVY_MODULES = ('requests', 'bs4', 'dateutil', 'mysql')
+RUNS = 5
+
+PROBE = (
+    "import sys, runpy\n"
+    f"sys.argv = [{SCRIPT!r}, '--help']\n"
+    "try:\n"
+    f"    runpy.run_path({SCRIPT!r}, run_name='__main__')\n"
+    "except SystemExit:\n"
+    "    pass\n"
+    f"sys.stderr.write(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+)
+
+
+def median_ms(cmd):
+    timings = []
+    output = ''
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        timings.append((time.perf_counter() - started) * 1000)
+        output = result.stderr
+    return sorted(timings)[len(timings) // 2], output
+
+
+@pytest.fixture(scope='module')
+def startup():
+    baseline_ms, _ = median_ms([sys.executable, '-c', 'pass'])
+    help_ms, loaded = median_ms([sys.executable, '-c', PROBE])
+    print(f"--help: {help_ms:.1f} ms (interpreter {baseline_ms:.1f} ms, overhead {help_ms - baseline_ms:.1f} ms)")
+    return help_ms - baseline_ms, loaded
+
+
+def test_no_heavy_imports_at_startup(startup):
+    _, loaded = startup
+    assert not loaded, f"modul berat ter-import saat startup: {loaded}"
+
+
+def test_startup_within_budget(startup):
+    overhead_ms, _ = startup
+    assert overhead_ms <= BUDGET_MS, f"startup {overhead_ms:.1f} ms > budget {BUDGET_MS} ms"